@@ -1,28 +1,34 @@
 """FastAPI application entry point for Plantit backend."""
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 from contextvars import ContextVar
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, timezone
 from threading import Lock
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, Iterator, List, NoReturn, Sequence, Tuple
 from uuid import uuid4
 
+import orjson
 from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.responses import Response
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from sqlalchemy import Integer, Row, String, delete, func, literal, select, union_all, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from backend.data import seed_content
 from backend.db import models
+from backend.db.ids import new_id
 from backend.db.migrate import ensure_migrations, get_migration_state
 from backend.db.seed import seed_demo_data
-from backend.db.session import engine, get_session, session_scope
+from backend.db.session import SessionLocal, engine, get_session, session_scope
 from plantit import __version__
 
 LOGGER = logging.getLogger("plantit.backend")
@@ -103,6 +109,9 @@ ALLOWED_ORIGINS = _env_list("PLANTIT_CORS_ALLOW_ORIGINS", DEFAULT_ALLOWED_ORIGIN
 
 _DASHBOARD_ALERTS_LOCK = Lock()
 _DASHBOARD_ALERTS: list[Dict[str, Any]] = []
+# Alerts only change when they are reset or dismissed, so they are re-encoded
+# then and every dashboard read splices the cached bytes into its body.
+_DASHBOARD_ALERTS_JSON = b"[]"
 
 _WATERING_DISMISSALS_LOCK = Lock()
 _WATERING_DISMISSALS: dict[str, date] = {}
@@ -111,9 +120,11 @@ _WATERING_DISMISSALS: dict[str, date] = {}
 def _reset_dashboard_alerts() -> None:
     """Restore dashboard alerts to their seeded defaults."""
 
+    global _DASHBOARD_ALERTS_JSON
     with _DASHBOARD_ALERTS_LOCK:
         _DASHBOARD_ALERTS.clear()
         _DASHBOARD_ALERTS.extend(dict(alert) for alert in seed_content.DASHBOARD_ALERTS)
+        _DASHBOARD_ALERTS_JSON = orjson.dumps(_DASHBOARD_ALERTS)
 
 
 _reset_dashboard_alerts()
@@ -147,7 +158,9 @@ def _set_security_headers(response: Response) -> None:
     for header, value in _SECURITY_HEADERS.items():
         response.headers.setdefault(header, value)
 
-app = FastAPI(title="Plantit Backend")
+# Routes that return plain dicts are encoded with orjson rather than the stdlib
+# json module.
+app = FastAPI(title="Plantit Backend", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -167,14 +180,11 @@ def _bootstrap_once() -> None:
     applied = ensure_migrations(engine)
     if applied:
         LOGGER.info("migrations-applied", extra={"versions": applied})
-    with session_scope() as session:
+    with session_scope(immediate=True) as session:
         seed_demo_data(session)
     _BOOTSTRAPPED = True
 
 
-_bootstrap_once()
-
-
 def _is_request_authenticated(request: Request) -> bool:
     """Determine whether the incoming request holds a valid auth session."""
 
@@ -282,13 +292,36 @@ async def _inject_correlation_id(request: Request, call_next):
         _CORRELATION_ID.reset(token)
 
 
-@app.middleware("http")
-async def _apply_security_headers_middleware(request: Request, call_next):
-    response = await call_next(request)
-    _set_security_headers(response)
-    return response
+class _SecurityHeadersMiddleware:
+    """Pure ASGI middleware adding the security headers to every response.
+
+    When the CSP toggle is off, requests pass straight through instead of
+    paying for a ``BaseHTTPMiddleware`` hop that would do nothing.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not SECURITY_HEADERS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for header, value in _SECURITY_HEADERS.items():
+                    headers.setdefault(header, value)
+            await send(message)
 
+        await self.app(scope, receive, send_with_headers)
 
+
+app.add_middleware(_SecurityHeadersMiddleware)
+
+
+# Migrations and seeding run once the server starts the app rather than when the
+# module is imported, so importing it (tooling, --reload, each worker) stays cheap.
 @app.on_event("startup")
 def _startup_event() -> None:
     LOGGER.info("backend-startup")
@@ -323,6 +356,19 @@ async def _http_exception_handler(request: Request, exc: HTTPException) -> JSONR
     return response
 
 
+@app.exception_handler(StaleDataError)
+async def _stale_data_exception_handler(request: Request, exc: StaleDataError) -> JSONResponse:
+    # Another request bumped the row version between this request's read and its
+    # flush; report it like any other optimistic-concurrency conflict.
+    return await _http_exception_handler(
+        request,
+        HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Record has been modified. Refresh and retry.",
+        ),
+    )
+
+
 @app.exception_handler(Exception)
 async def _unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     correlation_id = getattr(request.state, "correlation_id", None) or str(uuid4())
@@ -341,10 +387,96 @@ async def _unhandled_exception_handler(request: Request, exc: Exception) -> JSON
     return response
 
 
+# ETagged API responses may be kept by the browser but must be revalidated on
+# every use: the SPA refetches right after its own writes, so a max-age window
+# would show stale lists, and "private" keeps per-user data out of shared caches.
+# Revalidation is cheap because unchanged requests are answered with a 304.
+_CACHE_CONTROL = "private, no-cache"
+
+
+def _validator_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header names the given entity tag."""
+
+    if not if_none_match:
+        return False
+    # Browsers echo back exactly the tag they were sent, so that comparison is
+    # tried before splitting the header into a list of candidates.
+    if if_none_match == etag:
+        return True
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _json_response(
+    payload: Dict[str, Any], request: Request | None = None, etag: str | None = None
+) -> Response:
+    """Encode a serialized payload straight into a JSON response.
+
+    List payloads are assembled from JSON-ready primitives by the serializers,
+    so they are encoded with orjson in one pass instead of going through
+    FastAPI's response validation and the stdlib encoder.
+
+    Unless the caller already derived an ``etag``, the entity tag is a BLAKE2b
+    digest of the encoded body, so the bytes are hashed once rather than
+    re-serialized for the tag. When the request already holds that tag the body
+    is dropped and ``304 Not Modified`` is returned.
+    """
+
+    body = orjson.dumps(payload)
+    if etag is None:
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if request is not None:
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+    return Response(content=body, media_type="application/json", headers=_validator_headers(etag))
+
+
+def _catalog_etag(session: Session, scope: str) -> str:
+    """Return a weak entity tag for village/plant data without loading rows.
+
+    The tag digests ``scope`` (the route and its query), the village and plant
+    counts with their newest ``updated_at``, and the UTC date that
+    ``daysSinceWatered`` depends on. One aggregate row is enough to answer an
+    unchanged request with 304 before any payload is built.
+    """
+
+    return _version_etag(scope, session.execute(_SELECT_CATALOG_VERSION).one())
+
+
+def _version_etag(scope: str, version: Sequence[Any]) -> str:
+    """Digest a route scope, version columns and today's date into a weak ETag."""
+
+    key = "|".join((scope, _today_utc_date().isoformat(), *map(str, version)))
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """Return an empty 304 response when the request already holds ``etag``."""
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=_validator_headers(etag)
+        )
+    return None
+
+
 def _serialize_timestamp(value: datetime | None) -> str | None:
     if value is None:
         return None
-    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Timestamps loaded from the database are already tagged UTC, so the
+    # conversion only runs for client-supplied values with another offset.
+    if value.tzinfo is not timezone.utc:
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()[:-6] + "Z"
 
 
 def _serialize_date(value: date | datetime | None) -> str | None:
@@ -355,7 +487,7 @@ def _serialize_date(value: date | datetime | None) -> str | None:
     return value.isoformat()
 
 
-def _compute_days_since_watered(plant: models.Plant) -> int | None:
+def _compute_days_since_watered(plant: models.Plant, today: date | None = None) -> int | None:
     target: date | None
     if plant.last_watered is not None:
         target = plant.last_watered
@@ -365,46 +497,17 @@ def _compute_days_since_watered(plant: models.Plant) -> int | None:
         target = None
     if target is None:
         return None
-    delta = _today_utc_date() - target
-    if delta.days < 0:
-        return 0
-    return delta.days
+    if today is None:
+        today = _today_utc_date()
+    return max(0, today.toordinal() - target.toordinal())
 
 
 def _serialize_activity_log(plant: models.Plant) -> list[Dict[str, Any]]:
-    entries = plant.activity_log or []
-    if not isinstance(entries, Sequence):
-        return []
-    serialized: list[Dict[str, Any]] = []
-    for entry in entries:
-        if not isinstance(entry, dict):
-            continue
-        date_value = entry.get("date")
-        date_iso: str | None
-        if isinstance(date_value, date):
-            date_iso = date_value.isoformat()
-        elif isinstance(date_value, datetime):
-            date_iso = date_value.date().isoformat()
-        elif isinstance(date_value, str):
-            try:
-                parsed = date.fromisoformat(date_value)
-            except ValueError:
-                date_iso = None
-            else:
-                date_iso = parsed.isoformat()
-        else:
-            date_iso = None
-        serialized_entry: Dict[str, Any] = {
-            "date": date_iso,
-            "type": str(entry.get("type") or "note"),
-            "note": str(entry.get("note") or ""),
-        }
-        if entry.get("amount"):
-            serialized_entry["amount"] = str(entry["amount"])
-        if entry.get("method"):
-            serialized_entry["method"] = str(entry["method"])
-        serialized.append(serialized_entry)
-    return serialized
+    # Entries are normalized before they are stored, by the request validator on
+    # writes and by the seed sanitizer, so reads hand back the stored list as-is
+    # instead of re-validating every entry of every plant.
+    entries = plant.activity_log
+    return entries if isinstance(entries, list) else []
 
 
 def _now_utc() -> datetime:
@@ -425,45 +528,225 @@ def _touch_plant(plant: models.Plant | None) -> None:
         plant.updated_at = _now_utc()
 
 
-def _serialize_village_summary(village: models.Village) -> Dict[str, Any]:
-    banner_sources = [
-        plant.image_url
-        for plant in sorted(
-            (candidate for candidate in village.plants if candidate.image_url),
-            key=lambda candidate: candidate.updated_at,
-            reverse=True,
-        )[:6]
-    ]
+def _select_plant_detail(plant_id: str):
+    """Return the statement loading a plant with everything its detail payload reads.
+
+    The owning village is a non-null many-to-one, so it rides along on an inner
+    join; only the waterings collection needs a second SELECT. Any other
+    relationship access raises instead of quietly lazy loading per request.
+    """
+
+    return (
+        select(models.Plant)
+        .options(
+            joinedload(models.Plant.village, innerjoin=True),
+            selectinload(models.Plant.waterings),
+            raiseload("*"),
+        )
+        .where(models.Plant.id == plant_id)
+    )
+
+
+# Statements without per-request parameters are built once at import; their
+# compiled SQL is then served from SQLAlchemy's statement cache on each request.
+_SELECT_DUE_CANDIDATES = (
+    select(models.Plant)
+    .options(
+        joinedload(models.Plant.village, innerjoin=True),
+        selectinload(models.Plant.waterings),
+        raiseload("*"),
+    )
+    .order_by(models.Plant.display_name)
+)
+# Today's tasks are read as plain column tuples; the list never needs ORM
+# instances, so row hydration and identity-map bookkeeping are skipped.
+_SELECT_TODAY_TASKS = select(
+    models.Task.id,
+    models.Task.task_type,
+    models.Task.plant_id,
+    models.Task.plant_name,
+    models.Task.village_name,
+    models.Task.due_at,
+    models.Task.priority,
+).order_by(models.Task.due_at)
+# All dashboard metrics come back in one row: plant count and average health
+# share a single pass over plants, the other tables are counted as subqueries.
+_PLANT_TOTALS = select(
+    func.count(models.Plant.id).label("total_plants"),
+    func.avg(models.Plant.health_score).label("success_rate"),
+).subquery()
+_SELECT_DASHBOARD_SUMMARY = select(
+    _PLANT_TOTALS.c.total_plants,
+    select(func.count(models.Village.id)).scalar_subquery(),
+    _PLANT_TOTALS.c.success_rate,
+    select(func.count(models.Task.id)).scalar_subquery(),
+)
+# The export reads plain column rows rather than ORM instances; the village and
+# plant serializers only read attributes, which rows expose under the same names.
+_SELECT_EXPORT_VILLAGES = select(
+    models.Village.id,
+    models.Village.name,
+    models.Village.climate,
+    models.Village.health_score,
+    models.Village.updated_at,
+    models.Village.established_at,
+).order_by(models.Village.name, models.Village.id)
+# Row counts and newest timestamps change whenever a village or plant does: every
+# write touches updated_at and deletes change the counts.
+_SELECT_CATALOG_VERSION = select(
+    select(func.count(models.Village.id)).scalar_subquery(),
+    select(func.max(models.Village.updated_at)).scalar_subquery(),
+    select(func.count(models.Plant.id)).scalar_subquery(),
+    select(func.max(models.Plant.updated_at)).scalar_subquery(),
+)
+_SELECT_EXPORT_PLANTS = (
+    select(*models.Plant.__table__.c, models.Village.name.label("village_name"))
+    .join(models.Plant.village)
+    .order_by(
+        models.Village.name,
+        models.Village.id,
+        models.Plant.display_name,
+        models.Plant.id,
+    )
+)
+
+
+VILLAGE_BANNER_LIMIT = 6
+
+
+def _load_village_rollups(
+    session: Session, village_ids: Sequence[str]
+) -> Dict[str, Tuple[int, List[str]]]:
+    """Return ``(plant_count, banner_urls)`` for each of the given villages.
+
+    Counts and banners are computed in SQLite and returned by one UNION ALL so
+    summaries never load plant rows: the count half is answered from the
+    ``village_id`` index, and the newest six image URLs per village are ranked
+    over the partial ``ix_plants_village_banner`` index.
+    """
+
+    if not village_ids:
+        return {}
+    counts = select(
+        models.Plant.village_id,
+        func.count().label("plant_count"),
+        literal(None, String).label("image_url"),
+        literal(0).label("banner_rank"),
+    ).where(models.Plant.village_id.in_(village_ids)).group_by(models.Plant.village_id)
+    ranked = (
+        select(
+            models.Plant.village_id,
+            models.Plant.image_url,
+            func.row_number()
+            .over(
+                partition_by=models.Plant.village_id,
+                order_by=models.Plant.updated_at.desc(),
+            )
+            .label("banner_rank"),
+        )
+        .where(
+            models.Plant.village_id.in_(village_ids),
+            models.Plant.image_url.is_not(None),
+            models.Plant.image_url != "",
+        )
+        .subquery()
+    )
+    banners = select(
+        ranked.c.village_id,
+        literal(None, Integer).label("plant_count"),
+        ranked.c.image_url,
+        ranked.c.banner_rank,
+    ).where(ranked.c.banner_rank <= VILLAGE_BANNER_LIMIT)
+    rollup = union_all(counts, banners).subquery()
+    rows = session.execute(
+        select(rollup).order_by(rollup.c.village_id, rollup.c.banner_rank)
+    )
+
+    rollups: Dict[str, Tuple[int, List[str]]] = {}
+    for village_id, plant_count, image_url, _rank in rows:
+        if plant_count is not None:
+            rollups[village_id] = (plant_count, [])
+        else:
+            rollups[village_id][1].append(image_url)
+    return rollups
+
+
+def _summarize_villages(
+    session: Session, villages: Sequence[models.Village]
+) -> List[Dict[str, Any]]:
+    """Serialize village summaries using SQL rollups instead of loaded plants."""
+
+    rollups = _load_village_rollups(session, [village.id for village in villages])
+    summaries: List[Dict[str, Any]] = []
+    for village in villages:
+        plant_count, banner_urls = rollups.get(village.id, (0, []))
+        summaries.append(
+            _serialize_village_summary(
+                village, plant_count=plant_count, banner_urls=banner_urls
+            )
+        )
+    return summaries
+
+
+def _serialize_village_summary(
+    village: models.Village,
+    *,
+    plant_count: int | None = None,
+    banner_urls: List[str] | None = None,
+) -> Dict[str, Any]:
+    if banner_urls is None:
+        banner_urls = [
+            plant.image_url
+            for plant in sorted(
+                (candidate for candidate in village.plants if candidate.image_url),
+                key=lambda candidate: candidate.updated_at,
+                reverse=True,
+            )[:VILLAGE_BANNER_LIMIT]
+        ]
+    if plant_count is None:
+        plant_count = len(village.plants)
     return {
         "id": village.id,
         "name": village.name,
         "climate": village.climate,
-        "plantCount": len(village.plants),
+        "plantCount": plant_count,
         "healthScore": village.health_score,
         "updatedAt": _serialize_timestamp(village.updated_at),
-        "bannerImageUrls": banner_sources,
+        "bannerImageUrls": banner_urls,
     }
 
 
-def _serialize_village_detail(village: models.Village) -> Dict[str, Any]:
-    summary = _serialize_village_summary(village)
-    return {
-        **summary,
-        "description": village.description,
-        "establishedAt": village.established_at.isoformat()
-        if village.established_at
-        else None,
-        "irrigationType": village.irrigation_type,
-    }
+def _serialize_village_detail(
+    village: models.Village, summary: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    # Summaries are built fresh per call, so the detail fields are added in place
+    # rather than copying every key into a second dict.
+    if summary is None:
+        summary = _serialize_village_summary(village)
+    summary["description"] = village.description
+    summary["establishedAt"] = _serialize_date(village.established_at)
+    summary["irrigationType"] = village.irrigation_type
+    return summary
+
 
+def _serialize_plant_summary(plant: models.Plant, today: date | None = None) -> Dict[str, Any]:
+    # List endpoints pass one ``today`` for the whole batch rather than reading
+    # the clock once per plant.
+    village_name = plant.village.name if plant.village else None
+    return _serialize_plant_fields(plant, village_name, today)
 
-def _serialize_plant_summary(plant: models.Plant) -> Dict[str, Any]:
+
+def _serialize_plant_fields(
+    plant: models.Plant | Row, village_name: str | None, today: date | None = None
+) -> Dict[str, Any]:
+    # Shared by ORM plants and the export's column rows, which carry the
+    # village name as a labelled column instead of a loaded relationship.
     return {
         "id": plant.id,
         "displayName": plant.display_name,
         "species": plant.species,
         "villageId": plant.village_id,
-        "villageName": plant.village.name if plant.village else None,
+        "villageName": village_name,
         "stage": plant.stage,
         "lastWateredAt": _serialize_timestamp(plant.last_watered_at),
         "healthScore": plant.health_score,
@@ -483,22 +766,19 @@ def _serialize_plant_summary(plant: models.Plant) -> Dict[str, Any]:
         "waterAverage": plant.water_average,
         "amount": plant.amount,
         "activityLog": _serialize_activity_log(plant),
-        "daysSinceWatered": _compute_days_since_watered(plant),
+        "daysSinceWatered": _compute_days_since_watered(plant, today),
     }
 
 
-def _serialize_plant_detail(plant: models.Plant) -> Dict[str, Any]:
-    summary = _serialize_plant_summary(plant)
-    return {
-        **summary,
-        "notes": plant.notes,
-        "villageId": plant.village_id,
-        "villageName": plant.village.name if plant.village else None,
-        "watering": _serialize_watering_detail(plant),
-    }
+def _serialize_plant_detail(plant: models.Plant, today: date | None = None) -> Dict[str, Any]:
+    if today is None:
+        today = _today_utc_date()
+    payload = _serialize_plant_summary(plant, today)
+    payload["watering"] = _serialize_watering_detail(plant, today)
+    return payload
 
 
-def _serialize_watering_detail(plant: models.Plant) -> Dict[str, Any]:
+def _serialize_watering_detail(plant: models.Plant, today: date | None = None) -> Dict[str, Any]:
     history_dates = [
         watering.watered_at
         for watering in sorted(plant.waterings, key=lambda record: record.watered_at)
@@ -506,11 +786,12 @@ def _serialize_watering_detail(plant: models.Plant) -> Dict[str, Any]:
     ]
     history_strings = [value.isoformat() for value in history_dates]
     next_date = _predict_next_watering_date(history_dates)
-    today = _today_utc_date().isoformat()
+    if today is None:
+        today = _today_utc_date()
     return {
         "history": history_strings,
         "nextWateringDate": next_date.isoformat() if next_date else None,
-        "hasWateringToday": today in history_strings,
+        "hasWateringToday": today in history_dates,
     }
 
 
@@ -520,24 +801,23 @@ def _predict_next_watering_date(history: Sequence[date]) -> date | None:
     if count < 2:
         return None
 
-    indices = list(range(count))
+    # Least-squares fit of ordinal against index 0..count-1. The index sums have
+    # closed forms, so only the ordinals are walked and the fit stays in exact
+    # integer arithmetic until the final division.
     ordinals = [value.toordinal() for value in unique_sorted]
-    mean_index = sum(indices) / count
-    mean_ordinal = sum(ordinals) / count
-    denominator = sum((index - mean_index) ** 2 for index in indices)
-
-    if denominator == 0:
-        interval = max(1, ordinals[-1] - ordinals[-2])
-        return unique_sorted[-1] + timedelta(days=interval)
-
-    numerator = sum(
-        (index - mean_index) * (ordinal - mean_ordinal)
-        for index, ordinal in zip(indices, ordinals)
-    )
-    slope = numerator / denominator
-    intercept = mean_ordinal - slope * mean_index
-    predicted_ordinal = slope * count + intercept
-    rounded = round(predicted_ordinal)
+    sum_index = count * (count - 1) // 2
+    sum_index_sq = (count - 1) * count * (2 * count - 1) // 6
+    sum_ordinal = sum(ordinals)
+    sum_product = sum(index * ordinal for index, ordinal in enumerate(ordinals))
+    spread = count * sum_index_sq - sum_index * sum_index
+    covariance = count * sum_product - sum_index * sum_ordinal
+    # Prediction at index ``count`` is mean + slope * (count - mean_index), kept
+    # as a fraction and rounded half to even like ``round``.
+    numerator = 2 * spread * sum_ordinal + count * (count + 1) * covariance
+    denominator = 2 * count * spread
+    rounded, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and rounded % 2):
+        rounded += 1
     minimum_next = ordinals[-1] + 1
     target = max(minimum_next, rounded)
     return date.fromordinal(target)
@@ -559,19 +839,19 @@ def _normalize_image_url(value: Any) -> str | None:
 
 
 def _active_watering_dismissals(today: date) -> set[str]:
+    # One pass sorts entries into today's set and the expired ones to drop,
+    # instead of a list comprehension, a pop loop and a second set scan.
+    active: set[str] = set()
+    expired: list[str] = []
     with _WATERING_DISMISSALS_LOCK:
-        expired = [
-            plant_id
-            for plant_id, dismissed_on in _WATERING_DISMISSALS.items()
-            if dismissed_on < today
-        ]
+        for plant_id, dismissed_on in _WATERING_DISMISSALS.items():
+            if dismissed_on == today:
+                active.add(plant_id)
+            elif dismissed_on < today:
+                expired.append(plant_id)
         for plant_id in expired:
-            _WATERING_DISMISSALS.pop(plant_id, None)
-        return {
-            plant_id
-            for plant_id, dismissed_on in _WATERING_DISMISSALS.items()
-            if dismissed_on == today
-        }
+            del _WATERING_DISMISSALS[plant_id]
+    return active
 
 
 def _dismiss_watering_for_today(plant_id: str, today: date) -> None:
@@ -579,20 +859,38 @@ def _dismiss_watering_for_today(plant_id: str, today: date) -> None:
         _WATERING_DISMISSALS[plant_id] = today
 
 
-def _assert_village_version(village: models.Village, expected: datetime) -> None:
-    if _serialize_timestamp(village.updated_at) != _serialize_timestamp(expected):
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Village has been modified. Refresh and retry.",
-        )
+def _versions_match(current: datetime | None, expected: datetime) -> bool:
+    """Compare a stored version token with the client's by instant, not by text."""
 
+    if current is None:
+        return False
+    if expected.tzinfo is None:
+        expected = expected.astimezone(timezone.utc)
+    return current == expected
+
+
+def _raise_village_conflict() -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Village has been modified. Refresh and retry.",
+    )
+
+
+def _raise_plant_conflict() -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Plant has been modified. Refresh and retry.",
+    )
 
-def _assert_plant_version(plant: models.Plant, expected: datetime) -> None:
-    if _serialize_timestamp(plant.updated_at) != _serialize_timestamp(expected):
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Plant has been modified. Refresh and retry.",
-        )
+
+def _assert_village_version(current: datetime | None, expected: datetime) -> None:
+    if not _versions_match(current, expected):
+        _raise_village_conflict()
+
+
+def _assert_plant_version(current: datetime | None, expected: datetime) -> None:
+    if not _versions_match(current, expected):
+        _raise_plant_conflict()
 
 
 class AuthStatusResponse(BaseModel):
@@ -613,6 +911,26 @@ class LoginRequest(BaseModel):
     password: str = Field(..., min_length=1, max_length=128)
 
 
+def _strip_required_text(value: str) -> str:
+    """Shared validator: trim a required string and reject blank values."""
+
+    normalized = value.strip()
+    if not normalized:
+        raise ValueError("must not be empty")
+    return normalized
+
+
+def _strip_optional_text(value: Any) -> Any:
+    """Shared validator: trim an optional string, collapsing blanks to ``None``."""
+
+    if value is None:
+        return None
+    if isinstance(value, str):
+        trimmed = value.strip()
+        return trimmed or None
+    return value
+
+
 class VillageBaseModel(BaseModel):
     name: str = Field(..., min_length=1)
     climate: str = Field(..., min_length=1)
@@ -621,24 +939,12 @@ class VillageBaseModel(BaseModel):
     irrigation_type: str | None = Field(default=None, alias="irrigationType")
     health_score: float = Field(..., ge=0.0, le=1.0, alias="healthScore")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
-    @validator("name", "climate")
-    def _validate_required(cls, value: str) -> str:  # noqa: N805 - pydantic signature
-        normalized = value.strip()
-        if not normalized:
-            raise ValueError("must not be empty")
-        return normalized
-
-    @validator("description", "irrigation_type", pre=True)
-    def _normalize_optional(cls, value: Any) -> Any:  # noqa: N805 - pydantic signature
-        if value is None:
-            return None
-        if isinstance(value, str):
-            trimmed = value.strip()
-            return trimmed or None
-        return value
+    _validate_required = field_validator("name", "climate")(_strip_required_text)
+    _normalize_optional = field_validator("description", "irrigation_type", mode="before")(
+        _strip_optional_text
+    )
 
 
 class VillageCreateRequest(VillageBaseModel):
@@ -678,37 +984,25 @@ class PlantBaseModel(BaseModel):
     amount: str | None = Field(default=None)
     activity_log: List[Dict[str, Any]] | None = Field(default=None, alias="activityLog")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
-    @validator("display_name", "species")
-    def _require_text(cls, value: str) -> str:  # noqa: N805 - pydantic signature
-        normalized = value.strip()
-        if not normalized:
-            raise ValueError("must not be empty")
-        return normalized
+    _require_text = field_validator("display_name", "species")(_strip_required_text)
 
-    @validator("stage")
-    def _validate_stage(cls, value: str) -> str:  # noqa: N805 - pydantic signature
+    @field_validator("stage")
+    @classmethod
+    def _validate_stage(cls, value: str) -> str:
         normalized = value.strip().lower()
         if normalized not in _VALID_STAGES:
             raise ValueError(f"stage must be one of {sorted(_VALID_STAGES)}")
         return normalized
 
-    @validator("notes", pre=True)
-    def _normalize_notes(cls, value: Any) -> Any:  # noqa: N805 - pydantic signature
-        if value is None:
-            return None
-        if isinstance(value, str):
-            trimmed = value.strip()
-            return trimmed or None
-        return value
-
-    @validator("image_url", pre=True)
-    def _validate_image(cls, value: Any) -> Any:  # noqa: N805 - pydantic signature
+    @field_validator("image_url", mode="before")
+    @classmethod
+    def _validate_image(cls, value: Any) -> Any:
         return _normalize_image_url(value)
 
-    @validator(
+    _trim_optional_text = field_validator(
+        "notes",
         "family",
         "plant_origin",
         "natural_habitat",
@@ -718,18 +1012,12 @@ class PlantBaseModel(BaseModel):
         "dormancy",
         "water_average",
         "amount",
-        pre=True,
-    )
-    def _trim_optional_text(cls, value: Any) -> Any:  # noqa: N805 - pydantic signature
-        if value is None:
-            return None
-        if isinstance(value, str):
-            trimmed = value.strip()
-            return trimmed or None
-        return value
+        mode="before",
+    )(_strip_optional_text)
 
-    @validator("activity_log", pre=True)
-    def _normalize_activity_log_validator(  # noqa: N805 - pydantic signature
+    @field_validator("activity_log", mode="before")
+    @classmethod
+    def _normalize_activity_log_validator(
         cls, value: Any
     ) -> List[Dict[str, Any]] | None:
         if value is None:
@@ -764,8 +1052,9 @@ class PlantBaseModel(BaseModel):
 class PlantCreateRequest(PlantBaseModel):
     village_id: str = Field(..., alias="villageId", min_length=1)
 
-    @validator("village_id")
-    def _normalize_village(cls, value: str) -> str:  # noqa: N805 - pydantic signature
+    @field_validator("village_id")
+    @classmethod
+    def _normalize_village(cls, value: str) -> str:
         normalized = value.strip()
         if not normalized:
             raise ValueError("villageId must not be empty")
@@ -776,8 +1065,9 @@ class PlantUpdateRequest(PlantBaseModel):
     updated_at: datetime = Field(..., alias="updatedAt")
     village_id: str | None = Field(default=None, alias="villageId")
 
-    @validator("village_id")
-    def _normalize_village(cls, value: str | None) -> str | None:  # noqa: N805 - pydantic signature
+    @field_validator("village_id")
+    @classmethod
+    def _normalize_village(cls, value: str | None) -> str | None:
         if value is None:
             return None
         normalized = value.strip()
@@ -793,31 +1083,30 @@ class PlantDeleteRequest(BaseModel):
 class PlantWateringRequest(BaseModel):
     watered_at: date | None = Field(default=None, alias="wateredAt")
 
-    class Config:
-        allow_population_by_field_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
-    @validator("watered_at")
-    def _validate_watering_date(
-        cls, value: date | None
-    ) -> date | None:  # noqa: N805 - pydantic signature
+    @field_validator("watered_at")
+    @classmethod
+    def _validate_watering_date(cls, value: date | None) -> date | None:
         if value is None:
             return None
         if value > _today_utc_date():
             raise ValueError("wateredAt cannot be in the future")
         return value
 @app.get("/api/health", tags=["Health"])
-def get_health() -> Dict[str, Any]:
+def get_health(session: Session = Depends(get_session)) -> Dict[str, Any]:
     """Return service readiness information."""
 
+    # Both probes share the request's pooled connection instead of checking
+    # out their own.
     try:
-        with engine.connect() as connection:
-            connection.execute(select(1))
+        session.execute(select(1))
         db_status = "ok"
     except Exception as exc:  # pragma: no cover - defensive logging path
         LOGGER.exception("db-health-check-failed")
         db_status = f"error: {exc.__class__.__name__}"
 
-    migration_state = get_migration_state(engine)
+    migration_state = get_migration_state(session.connection())
     migration_status = "ok" if not migration_state["pending"] else "pending: " + ", ".join(
         migration_state["pending"]
     )
@@ -830,19 +1119,26 @@ def get_health() -> Dict[str, Any]:
     }
 
 
+# The greeting never changes, so it is encoded once; each request only wraps the
+# bytes in a fresh Response because middleware may add headers to it.
+_HELLO_BODY = orjson.dumps({"message": "Hello, Plantit"})
+
+
 @app.get("/api/hello", tags=["Greetings"])
-def get_hello() -> Dict[str, str]:
+async def get_hello() -> Response:
     """Return a friendly greeting used for smoke tests."""
 
-    return {"message": "Hello, Plantit"}
+    return Response(content=_HELLO_BODY, media_type="application/json")
 
 
 @app.get("/api/auth/status", tags=["Auth"], response_model=AuthStatusResponse)
-async def get_auth_status(request: Request) -> AuthStatusResponse:
+async def get_auth_status(request: Request) -> JSONResponse:
     """Expose the current authentication status to the SPA."""
 
-    payload = _auth_status_payload(request)
-    return AuthStatusResponse(**payload)
+    # The payload is built from trusted primitives, so it is returned directly
+    # like the login/logout handlers instead of being validated into
+    # AuthStatusResponse and dumped back out again.
+    return JSONResponse(content=_auth_status_payload(request))
 
 
 @app.post("/api/auth/login", tags=["Auth"], response_model=AuthStatusResponse)
@@ -888,16 +1184,12 @@ async def logout(request: Request) -> JSONResponse:
 
 
 @app.get("/api/dashboard", tags=["Dashboard"])
-def get_dashboard(session: Session = Depends(get_session)) -> Dict[str, Any]:
+def get_dashboard(session: Session = Depends(get_session)) -> Response:
     """Return summary metrics and alerts for the dashboard cards."""
 
-    total_plants = session.execute(select(func.count(models.Plant.id))).scalar_one()
-    active_villages = session.execute(select(func.count(models.Village.id))).scalar_one()
-    success_rate = session.execute(select(func.avg(models.Plant.health_score))).scalar_one()
-    upcoming_tasks = session.execute(select(func.count(models.Task.id))).scalar_one()
-
-    with _DASHBOARD_ALERTS_LOCK:
-        alerts = [dict(alert) for alert in _DASHBOARD_ALERTS]
+    total_plants, active_villages, success_rate, upcoming_tasks = session.execute(
+        _SELECT_DASHBOARD_SUMMARY
+    ).one()
 
     summary = {
         "totalPlants": total_plants,
@@ -905,26 +1197,29 @@ def get_dashboard(session: Session = Depends(get_session)) -> Dict[str, Any]:
         "successRate": round(success_rate or 0.0, 2),
         "upcomingTasks": upcoming_tasks,
     }
-    return {
-        "summary": summary,
-        "alerts": alerts,
-        "lastUpdated": datetime.now(timezone.utc).isoformat(),
-    }
+    body = b'{"summary":%b,"alerts":%b,"lastUpdated":%b}' % (
+        orjson.dumps(summary),
+        _DASHBOARD_ALERTS_JSON,
+        orjson.dumps(_now_utc().isoformat()),
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @app.delete("/api/dashboard/alerts/{alert_id}", tags=["Dashboard"])
-def dismiss_dashboard_alert(alert_id: str) -> Dict[str, Any]:
+async def dismiss_dashboard_alert(alert_id: str) -> Dict[str, Any]:
     """Dismiss a dashboard alert."""
 
+    global _DASHBOARD_ALERTS_JSON
     with _DASHBOARD_ALERTS_LOCK:
         for index, alert in enumerate(_DASHBOARD_ALERTS):
             if alert.get("id") != alert_id:
                 continue
             _DASHBOARD_ALERTS.pop(index)
+            _DASHBOARD_ALERTS_JSON = orjson.dumps(_DASHBOARD_ALERTS)
             return {
                 "status": "dismissed",
                 "alertId": alert_id,
-                "dismissedAt": datetime.now(timezone.utc).isoformat(),
+                "dismissedAt": _now_utc().isoformat(),
             }
 
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found")
@@ -932,28 +1227,35 @@ def dismiss_dashboard_alert(alert_id: str) -> Dict[str, Any]:
 
 @app.get("/api/villages", tags=["Villages"])
 def list_villages(
+    request: Request,
     search_term: str = Query("", alias="searchTerm"),
     climate_zones: Sequence[str] = Query(default=(), alias="climateZones"),
     min_health: float | None = Query(default=None, alias="minHealth"),
     session: Session = Depends(get_session),
-) -> Dict[str, Any]:
+) -> Response:
     """Return the available village summaries and the applied filters."""
 
-    query = (
-        session.query(models.Village)
-        .options(selectinload(models.Village.plants))
-        .order_by(models.Village.name)
-    )
+    etag = _catalog_etag(session, f"{request.url.path}?{request.url.query}")
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
 
+    # The climate and health filters and the unfiltered name ordering are served
+    # by the villages indexes; the substring search cannot use an index, so it is
+    # applied to whatever rows the other predicates leave.
+    conditions = []
     if search_term:
         term = f"%{search_term.lower()}%"
-        query = query.filter(func.lower(models.Village.name).like(term))
+        conditions.append(func.lower(models.Village.name).like(term))
     if climate_zones:
-        query = query.filter(models.Village.climate.in_(climate_zones))
+        conditions.append(models.Village.climate.in_(climate_zones))
     if min_health is not None:
-        query = query.filter(models.Village.health_score >= min_health)
+        conditions.append(models.Village.health_score >= min_health)
+    statement = select(models.Village).where(*conditions).order_by(models.Village.name)
 
-    villages = [_serialize_village_summary(village) for village in query.all()]
+    # Plant counts and banner images come from one set-based rollup rather than
+    # loading every plant row (image data included) for each village.
+    villages = _summarize_villages(session, session.scalars(statement).all())
 
     applied_filters = {
         "searchTerm": search_term,
@@ -961,28 +1263,53 @@ def list_villages(
         "minHealth": min_health,
     }
 
-    return {"villages": villages, "appliedFilters": applied_filters}
+    return _json_response({"villages": villages, "appliedFilters": applied_filters}, etag=etag)
 
 
 @app.get("/api/villages/{village_id}", tags=["Villages"])
-def get_village(village_id: str, session: Session = Depends(get_session)) -> Dict[str, Any]:
+def get_village(
+    village_id: str, request: Request, session: Session = Depends(get_session)
+) -> Response:
     """Return additional information for a specific village."""
 
-    village = session.get(
-        models.Village,
-        village_id,
-        options=(selectinload(models.Village.plants),),
-    )
+    # The detail changes only with the village row or its plants, so their
+    # version is checked before the village is loaded and summarized.
+    version = session.execute(
+        select(
+            models.Village.updated_at,
+            func.count(models.Plant.id),
+            func.max(models.Plant.updated_at),
+        )
+        .outerjoin(models.Village.plants)
+        .where(models.Village.id == village_id)
+        .group_by(models.Village.id)
+    ).first()
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Village not found")
+    etag = _version_etag(request.url.path, version)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    village = session.get(models.Village, village_id)
     if village is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Village not found")
 
-    return {"village": _serialize_village_detail(village)}
+    (summary,) = _summarize_villages(session, [village])
+    return _json_response({"village": _serialize_village_detail(village, summary)}, etag=etag)
 
 
 @app.get("/api/villages/{village_id}/plants", tags=["Plants"])
-def list_village_plants(village_id: str, session: Session = Depends(get_session)) -> Dict[str, Any]:
+def list_village_plants(
+    village_id: str, request: Request, session: Session = Depends(get_session)
+) -> Response:
     """Return plants that belong to the requested village."""
 
+    etag = _catalog_etag(session, request.url.path)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
     village = session.get(
         models.Village,
         village_id,
@@ -993,38 +1320,30 @@ def list_village_plants(village_id: str, session: Session = Depends(get_session)
 
     village_summary = _serialize_village_summary(village)
 
-    plants = [_serialize_plant_summary(plant) for plant in village.plants]
+    today = _today_utc_date()
+    plants = [_serialize_plant_summary(plant, today) for plant in village.plants]
 
-    return {"village": village_summary, "plants": plants}
+    return _json_response({"village": village_summary, "plants": plants}, etag=etag)
 
 
 @app.get("/api/watering/due", tags=["Plants"])
-def list_due_watering_plants(session: Session = Depends(get_session)) -> Dict[str, Any]:
+def list_due_watering_plants(session: Session = Depends(get_session)) -> Response:
     """Return plants that require watering today or are overdue."""
 
     today = _today_utc_date()
     dismissed_today = _active_watering_dismissals(today)
 
-    query = (
-        session.query(models.Plant)
-        .options(
-            selectinload(models.Plant.village),
-            selectinload(models.Plant.waterings),
-        )
-        .order_by(models.Plant.display_name)
-    )
-
     due_plants: list[Dict[str, Any]] = []
-    for plant in query.all():
-        watering = _serialize_watering_detail(plant)
-        next_watering = watering.get("nextWateringDate")
-        if not next_watering or watering.get("hasWateringToday"):
+    for plant in session.scalars(_SELECT_DUE_CANDIDATES):
+        if plant.id in dismissed_today:
             continue
-        try:
-            next_date = date.fromisoformat(next_watering)
-        except ValueError:
-            continue
-        if next_date > today or plant.id in dismissed_today:
+        # Compare predicted dates against today's bound directly instead of
+        # serializing the full watering detail and parsing the date back.
+        history = [
+            watering.watered_at for watering in plant.waterings if watering.watered_at is not None
+        ]
+        next_date = _predict_next_watering_date(history)
+        if next_date is None or next_date > today or today in history:
             continue
         due_plants.append(
             {
@@ -1032,17 +1351,17 @@ def list_due_watering_plants(session: Session = Depends(get_session)) -> Dict[st
                 "displayName": plant.display_name,
                 "villageId": plant.village_id,
                 "villageName": plant.village.name if plant.village else None,
-                "nextWateringDate": next_watering,
+                "nextWateringDate": next_date.isoformat(),
                 "lastWateredAt": _serialize_timestamp(plant.last_watered_at),
             }
         )
 
     due_plants.sort(key=lambda item: (item["nextWateringDate"] or "", item["displayName"]))
 
-    return {
-        "plants": due_plants,
-        "generatedAt": datetime.now(timezone.utc).isoformat(),
-    }
+    # generatedAt changes on every call, so the body is never a reusable
+    # validator; it is encoded without the ETag _json_response would hash.
+    body = orjson.dumps({"plants": due_plants, "generatedAt": _now_utc().isoformat()})
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/watering/due/{plant_id}/dismiss", tags=["Plants"])
@@ -1051,32 +1370,21 @@ def dismiss_due_watering_plant(
 ) -> Dict[str, Any]:
     """Dismiss a plant from today's watering queue."""
 
-    plant = session.get(
-        models.Plant,
-        plant_id,
-        options=(selectinload(models.Plant.waterings),),
-    )
-    if plant is None:
+    # Only the watering dates matter here, so fetch them as plain rows in one
+    # outer-joined statement instead of materializing the plant and its events.
+    rows = session.execute(
+        select(models.PlantWateringEvent.watered_at)
+        .select_from(models.Plant)
+        .outerjoin(models.Plant.waterings)
+        .where(models.Plant.id == plant_id)
+    ).all()
+    if not rows:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
 
     today = _today_utc_date()
-    watering = _serialize_watering_detail(plant)
-    next_watering = watering.get("nextWateringDate")
-    if not next_watering or watering.get("hasWateringToday"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Plant does not require watering today",
-        )
-
-    try:
-        next_date = date.fromisoformat(next_watering)
-    except ValueError as error:  # pragma: no cover - defensive
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Plant does not require watering today",
-        ) from error
-
-    if next_date > today:
+    history = [row.watered_at for row in rows if row.watered_at is not None]
+    next_date = _predict_next_watering_date(history)
+    if next_date is None or next_date > today or today in history:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Plant does not require watering today",
@@ -1099,19 +1407,23 @@ def create_village(
     """Create a new village record."""
 
     village = models.Village(
-        id=str(uuid4()),
+        id=new_id(),
         name=payload.name,
         climate=payload.climate,
         description=payload.description,
         established_at=payload.established_at,
         irrigation_type=payload.irrigation_type,
         health_score=payload.health_score,
+        plants=[],
     )
     session.add(village)
+    # Flushing applies column defaults such as updated_at, so the payload can be
+    # built from the instance with no refresh. The empty collections are set up
+    # front so serializing them needs no SELECT.
+    session.flush()
+    response = {"village": _serialize_village_detail(village)}
     session.commit()
-    session.refresh(village)
-
-    return {"village": _serialize_village_detail(village)}
+    return response
 
 
 @app.put("/api/villages/{village_id}", tags=["Villages"])
@@ -1123,15 +1435,11 @@ def update_village(
 ) -> Dict[str, Any]:
     """Update an existing village with optimistic concurrency checking."""
 
-    village = session.get(
-        models.Village,
-        village_id,
-        options=(selectinload(models.Village.plants),),
-    )
+    village = session.get(models.Village, village_id)
     if village is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Village not found")
 
-    _assert_village_version(village, payload.updated_at)
+    _assert_village_version(village.updated_at, payload.updated_at)
 
     village.name = payload.name
     village.climate = payload.climate
@@ -1140,10 +1448,10 @@ def update_village(
     village.irrigation_type = payload.irrigation_type
     village.health_score = payload.health_score
     _touch_village(village)
+    (summary,) = _summarize_villages(session, [village])
+    response = {"village": _serialize_village_detail(village, summary)}
     session.commit()
-    session.refresh(village)
-
-    return {"village": _serialize_village_detail(village)}
+    return response
 
 
 @app.delete("/api/villages/{village_id}", tags=["Villages"])
@@ -1155,17 +1463,29 @@ def delete_village(
 ) -> Dict[str, Any]:
     """Delete a village when the client holds the latest version token."""
 
-    village = session.get(
-        models.Village,
-        village_id,
-        options=(selectinload(models.Village.plants),),
-    )
-    if village is None:
+    # Only the version token is needed to authorize the delete, so read that one
+    # column and let the schema's ON DELETE CASCADE remove the village's plants,
+    # tasks and waterings rather than loading them for the ORM cascade.
+    current = session.execute(
+        select(models.Village.updated_at, models.Village.version).where(
+            models.Village.id == village_id
+        )
+    ).first()
+    if current is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Village not found")
 
-    _assert_village_version(village, payload.updated_at)
+    _assert_village_version(current.updated_at, payload.updated_at)
 
-    session.delete(village)
+    # The DELETE only matches the version that was just checked, so a write
+    # landing in between turns it into a conflict instead of being erased.
+    deleted = session.execute(
+        delete(models.Village).where(
+            models.Village.id == village_id, models.Village.version == current.version
+        )
+    )
+    if deleted.rowcount == 0:
+        session.rollback()
+        _raise_village_conflict()
     session.commit()
 
     return {
@@ -1176,23 +1496,32 @@ def delete_village(
 
 
 @app.get("/api/plants/{plant_id}", tags=["Plants"])
-def get_plant(plant_id: str, session: Session = Depends(get_session)) -> Dict[str, Any]:
+def get_plant(
+    plant_id: str, request: Request, session: Session = Depends(get_session)
+) -> Response:
     """Return the plant detail payload and recent timeline events."""
 
-    plant = session.execute(
-        select(models.Plant)
-        .options(
-            selectinload(models.Plant.village),
-            selectinload(models.Plant.waterings),
-        )
+    # Waterings touch the plant and renames touch the village, so the two
+    # timestamps version the whole detail payload.
+    version = session.execute(
+        select(models.Plant.updated_at, models.Village.updated_at)
+        .join(models.Plant.village)
         .where(models.Plant.id == plant_id)
-    ).scalar_one_or_none()
+    ).first()
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
+    etag = _version_etag(request.url.path, version)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    plant = session.execute(_select_plant_detail(plant_id)).scalar_one_or_none()
     if plant is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
 
     plant_payload = _serialize_plant_detail(plant)
     timeline = seed_content.PLANT_TIMELINE.get(plant.id, [])
-    return {"plant": plant_payload, "timeline": timeline}
+    return _json_response({"plant": plant_payload, "timeline": timeline}, etag=etag)
 
 
 @app.post(
@@ -1208,14 +1537,7 @@ def record_plant_watering(
 ) -> Dict[str, Any]:
     """Record a watering for the given plant, defaulting to the current day."""
 
-    plant = session.execute(
-        select(models.Plant)
-        .options(
-            selectinload(models.Plant.village),
-            selectinload(models.Plant.waterings),
-        )
-        .where(models.Plant.id == plant_id)
-    ).scalar_one_or_none()
+    plant = session.execute(_select_plant_detail(plant_id)).scalar_one_or_none()
     if plant is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
 
@@ -1226,7 +1548,7 @@ def record_plant_watering(
     if existing is None:
         session.add(
             models.PlantWateringEvent(
-                id=str(uuid4()),
+                id=new_id(),
                 plant=plant,
                 watered_at=watered_at,
             )
@@ -1234,19 +1556,12 @@ def record_plant_watering(
 
     plant.last_watered_at = _now_utc()
     _touch_plant(plant)
-    session.commit()
 
-    refreshed = session.execute(
-        select(models.Plant)
-        .options(
-            selectinload(models.Plant.village),
-            selectinload(models.Plant.waterings),
-        )
-        .where(models.Plant.id == plant_id)
-    ).scalar_one()
-
-    plant_payload = _serialize_plant_detail(refreshed)
-    timeline = seed_content.PLANT_TIMELINE.get(refreshed.id, [])
+    # The loaded graph already reflects the new watering, so it is serialized as
+    # is rather than reloading the plant.
+    plant_payload = _serialize_plant_detail(plant)
+    timeline = seed_content.PLANT_TIMELINE.get(plant.id, [])
+    session.commit()
     return {"plant": plant_payload, "timeline": timeline}
 
 
@@ -1258,16 +1573,14 @@ def create_plant(
 ) -> Dict[str, Any]:
     """Create a plant within the specified village."""
 
-    village = session.get(
-        models.Village,
-        payload.village_id,
-        options=(selectinload(models.Village.plants),),
-    )
+    # The village's plants are never loaded; attaching the new plant queues the
+    # collection append and the summary comes from the SQL rollup.
+    village = session.get(models.Village, payload.village_id)
     if village is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Village not found")
 
     plant = models.Plant(
-        id=str(uuid4()),
+        id=new_id(),
         village=village,
         display_name=payload.display_name,
         species=payload.species,
@@ -1289,20 +1602,19 @@ def create_plant(
         water_average=payload.water_average,
         amount=payload.amount,
         activity_log=payload.activity_log or [],
+        waterings=[],
     )
     session.add(plant)
     _touch_village(village)
+    session.flush()
+    # The flushed village already carries its new version, so the summary is
+    # built here rather than re-reading the village after the commit.
+    (village_summary,) = _summarize_villages(session, [village])
+    response: Dict[str, Any] = {
+        "plant": _serialize_plant_detail(plant),
+        "village": village_summary,
+    }
     session.commit()
-    session.refresh(plant)
-    updated_village = session.get(
-        models.Village,
-        plant.village_id,
-        options=(selectinload(models.Village.plants),),
-    )
-
-    response: Dict[str, Any] = {"plant": _serialize_plant_detail(plant)}
-    if updated_village is not None:
-        response["village"] = _serialize_village_summary(updated_village)
     return response
 
 
@@ -1319,24 +1631,21 @@ def update_plant(
         models.Plant,
         plant_id,
         options=(
-            selectinload(models.Plant.village),
+            joinedload(models.Plant.village, innerjoin=True),
             selectinload(models.Plant.waterings),
+            raiseload("*"),
         ),
     )
     if plant is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
 
-    _assert_plant_version(plant, payload.updated_at)
+    _assert_plant_version(plant.updated_at, payload.updated_at)
 
     original_village_id = plant.village_id
     original_village = plant.village
 
     if payload.village_id is not None and payload.village_id != plant.village_id:
-        target_village = session.get(
-            models.Village,
-            payload.village_id,
-            options=(selectinload(models.Village.plants),),
-        )
+        target_village = session.get(models.Village, payload.village_id)
         if target_village is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Village not found")
         plant.village = target_village
@@ -1370,30 +1679,20 @@ def update_plant(
         and original_village.id != plant.village_id
     ):
         _touch_village(original_village)
-    session.commit()
-    session.refresh(plant)
-
-    updated_village = None
-    if plant.village_id is not None:
-        updated_village = session.get(
-            models.Village,
-            plant.village_id,
-            options=(selectinload(models.Village.plants),),
-        )
-
-    previous_village = None
-    if original_village_id and original_village_id != plant.village_id:
-        previous_village = session.get(
-            models.Village,
-            original_village_id,
-            options=(selectinload(models.Village.plants),),
-        )
-
+    # Flush so village_id reflects a move, then build the payload from the loaded
+    # plant instead of refreshing it.
+    session.flush()
     response: Dict[str, Any] = {"plant": _serialize_plant_detail(plant)}
-    if updated_village is not None:
-        response["village"] = _serialize_village_summary(updated_village)
-    if previous_village is not None:
-        response["previousVillage"] = _serialize_village_summary(previous_village)
+
+    # Both affected villages are already loaded and touched, so they are
+    # summarized from one shared rollup rather than read back.
+    moved = bool(original_village_id) and original_village_id != plant.village_id
+    villages = [plant.village, original_village] if moved else [plant.village]
+    summaries = _summarize_villages(session, villages)
+    response["village"] = summaries[0]
+    if moved:
+        response["previousVillage"] = summaries[1]
+    session.commit()
     return response
 
 
@@ -1406,29 +1705,38 @@ def delete_plant(
 ) -> Dict[str, Any]:
     """Remove a plant, returning the updated village summary."""
 
-    plant = session.get(
-        models.Plant,
-        plant_id,
-        options=(selectinload(models.Plant.village),),
-    )
-    if plant is None:
+    # Read just the version token and owning village instead of the full plant
+    # row (image data included) and its village.
+    current = session.execute(
+        select(
+            models.Plant.updated_at, models.Plant.version, models.Plant.village_id
+        ).where(models.Plant.id == plant_id)
+    ).first()
+    if current is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
 
-    _assert_plant_version(plant, payload.updated_at)
-
-    owning_village = plant.village
-    _touch_village(owning_village)
-    village_id = plant.village_id
-    session.delete(plant)
-    session.commit()
+    _assert_plant_version(current.updated_at, payload.updated_at)
 
-    updated_village = None
-    if village_id is not None:
-        updated_village = session.get(
-            models.Village,
-            village_id,
-            options=(selectinload(models.Village.plants),),
+    # Tasks and watering events go with the plant through the schema's
+    # ON DELETE CASCADE rather than being loaded or deleted here. The DELETE only
+    # matches the checked version, and runs before the village is touched, so a
+    # write landing in between is reported as a conflict and changes nothing.
+    deleted = session.execute(
+        delete(models.Plant).where(
+            models.Plant.id == plant_id, models.Plant.version == current.version
         )
+    )
+    if deleted.rowcount == 0:
+        session.rollback()
+        _raise_plant_conflict()
+
+    # Touching the village returns its row, so the summary needs no re-read.
+    updated_village = session.scalars(
+        update(models.Village)
+        .where(models.Village.id == current.village_id)
+        .values(updated_at=_now_utc(), version=models.Village.version + 1)
+        .returning(models.Village)
+    ).one_or_none()
 
     response: Dict[str, Any] = {
         "status": "deleted",
@@ -1436,38 +1744,69 @@ def delete_plant(
         "updatedAt": _serialize_timestamp(payload.updated_at),
     }
     if updated_village is not None:
-        response["village"] = _serialize_village_summary(updated_village)
+        (response["village"],) = _summarize_villages(session, [updated_village])
+    session.commit()
     return response
 
 
 @app.get("/api/today", tags=["Today"])
-def get_today_tasks(session: Session = Depends(get_session)) -> Dict[str, Any]:
+def get_today_tasks(request: Request, session: Session = Depends(get_session)) -> Response:
     """Return the list of scheduled tasks for the current day."""
 
-    tasks = session.query(models.Task).order_by(models.Task.due_at).all()
-    return {
-        "tasks": [
-            {
-                "id": task.id,
-                "type": task.task_type,
-                "plantId": task.plant_id,
-                "plantName": task.plant_name,
-                "villageName": task.village_name,
-                "dueAt": task.due_at.isoformat(),
-                "priority": task.priority,
-            }
-            for task in tasks
-        ],
-        "emptyStateMessage": None,
-    }
+    # due_at is handed to orjson as a datetime; it emits the same ISO 8601 text
+    # as isoformat() without a Python-level call per row.
+    rows = session.execute(_SELECT_TODAY_TASKS)
+    return _json_response(
+        {
+            "tasks": [
+                {
+                    "id": task_id,
+                    "type": task_type,
+                    "plantId": plant_id,
+                    "plantName": plant_name,
+                    "villageName": village_name,
+                    "dueAt": due_at,
+                    "priority": priority,
+                }
+                for task_id, task_type, plant_id, plant_name, village_name, due_at, priority in rows
+            ],
+            "emptyStateMessage": None,
+        },
+        request,
+    )
 
 
-@app.post("/api/import", tags=["Import/Export"], status_code=status.HTTP_202_ACCEPTED)
-def post_import_bundle(
-    bundle: Dict[str, Any], _: None = Depends(require_authentication)
+@app.post(
+    "/api/import",
+    tags=["Import/Export"],
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "object"}}},
+        }
+    },
+)
+async def post_import_bundle(
+    request: Request, _: None = Depends(require_authentication)
 ) -> Dict[str, Any]:
     """Accept an import preview payload for future processing."""
 
+    # Bundles can be large, so the raw body is decoded with orjson rather than
+    # the stdlib parser followed by a pydantic walk of the whole Dict[str, Any].
+    try:
+        bundle = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Import bundle must be valid JSON",
+        ) from error
+    if not isinstance(bundle, dict):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Import bundle must be a JSON object",
+        )
+
     schema_version = bundle.get("schemaVersion")
     summary = bundle.get("summary", {})
 
@@ -1484,37 +1823,67 @@ def post_import_bundle(
     }
 
 
+EXPORT_BATCH_SIZE = 500
+
+
+# The bundle's header fields are constants, so they are encoded once at import.
+_EXPORT_SCHEMA_VERSION_JSON = b'{"schemaVersion":' + orjson.dumps(
+    seed_content.EXPORT_METADATA["schemaVersion"]
+)
+_EXPORT_METADATA_JSON = b',"metadata":' + orjson.dumps(seed_content.EXPORT_METADATA["metadata"])
+
+
+def _iter_export_bundle() -> Iterator[bytes]:
+    """Yield the export bundle as JSON fragments, one batch of rows at a time.
+
+    Villages and plants are fetched with ``yield_per``, which also turns on
+    ``stream_results``, so rows are pulled from the cursor one batch at a time and
+    only that batch is resident. The generator owns its session because it runs
+    after the request's dependencies have been torn down.
+    """
+
+    encode = orjson.dumps
+    with SessionLocal() as session:
+        today = _today_utc_date()
+        yield _EXPORT_SCHEMA_VERSION_JSON
+        yield b',"generatedAt":' + encode(_now_utc().isoformat())
+        yield _EXPORT_METADATA_JSON
+
+        # Each batch is encoded as one JSON array in a single orjson call and
+        # spliced in without its brackets, instead of one call per row.
+        yield b',"payload":{"villages":['
+        separator = b""
+        villages = session.execute(
+            _SELECT_EXPORT_VILLAGES.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        for batch in villages.partitions():
+            summaries = _summarize_villages(session, batch)
+            for village, summary in zip(batch, summaries):
+                summary["establishedAt"] = _serialize_date(village.established_at)
+            yield separator + encode(summaries)[1:-1]
+            separator = b","
+
+        yield b'],"plants":['
+        separator = b""
+        plants = session.execute(
+            _SELECT_EXPORT_PLANTS.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        for batch in plants.partitions():
+            yield separator + encode(
+                [_serialize_plant_fields(plant, plant.village_name, today) for plant in batch]
+            )[1:-1]
+            separator = b","
+        yield b"]}}"
+
+
 @app.get("/api/export", tags=["Import/Export"])
-def get_export_bundle(session: Session = Depends(get_session)) -> Dict[str, Any]:
+def get_export_bundle(request: Request, session: Session = Depends(get_session)) -> Response:
     """Return a stub export bundle."""
 
-    villages = (
-        session.query(models.Village)
-        .options(selectinload(models.Village.plants))
-        .order_by(models.Village.name)
-        .all()
+    etag = _catalog_etag(session, "export")
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    return StreamingResponse(
+        _iter_export_bundle(), media_type="application/json", headers=_validator_headers(etag)
     )
-    payload_villages = [
-        {
-            **_serialize_village_summary(village),
-            "establishedAt": village.established_at.isoformat()
-            if village.established_at
-            else None,
-        }
-        for village in villages
-    ]
-    payload_plants = [
-        {
-            **_serialize_plant_summary(plant),
-            "villageId": plant.village_id,
-        }
-        for village in villages
-        for plant in village.plants
-    ]
-
-    return {
-        "schemaVersion": seed_content.EXPORT_METADATA["schemaVersion"],
-        "generatedAt": datetime.now(timezone.utc).isoformat(),
-        "metadata": seed_content.EXPORT_METADATA["metadata"],
-        "payload": {"villages": payload_villages, "plants": payload_plants},
-    }
@@ -0,0 +1,27 @@
+"""Identifier generation for new rows."""
+from __future__ import annotations
+
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """Return an RFC 9562 version 7 UUID: a millisecond timestamp, then random bits.
+
+    The timestamp leads, so identifiers created later sort after earlier ones and
+    new rows are appended at the right edge of the text primary-key B-tree rather
+    than splitting random pages the way ``uuid4`` values do.
+    """
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return UUID(int=value)
+
+
+def new_id() -> str:
+    """Return a fresh primary key for a village, plant or watering event."""
+
+    return str(uuid7())
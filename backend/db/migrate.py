@@ -3,8 +3,8 @@ from __future__ import annotations
 
 from typing import Dict, Iterable, List
 
-from sqlalchemy import text
-from sqlalchemy.engine import Engine
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
 
 from backend.db.migrations import LATEST_VERSION, MIGRATIONS
 
@@ -24,6 +24,11 @@ def ensure_migrations(engine: Engine) -> List[str]:
 
     applied_now: List[str] = []
     with engine.begin() as connection:
+        if connection.dialect.name == "sqlite":
+            # Take SQLite's write lock before reading the applied versions, so
+            # workers starting together run the migrations one after another
+            # and later ones see them as applied instead of repeating them.
+            connection.execute(text("BEGIN IMMEDIATE"))
         connection.execute(text(SCHEMA_TABLE_SQL))
         existing = {
             row[0] for row in connection.execute(text("SELECT version FROM schema_migrations"))
@@ -42,11 +47,16 @@ def ensure_migrations(engine: Engine) -> List[str]:
     return applied_now
 
 
-def get_migration_state(engine: Engine) -> Dict[str, object]:
-    """Return the applied and pending migration state."""
+def get_migration_state(connection: Connection) -> Dict[str, object]:
+    """Return the applied and pending migration state.
 
-    with engine.begin() as connection:
-        connection.execute(text(SCHEMA_TABLE_SQL))
+    The probe is read-only so health checks can run it on a request's pooled
+    connection without issuing DDL; a missing ``schema_migrations`` table
+    simply reports every migration as pending.
+    """
+
+    applied: set[str] = set()
+    if inspect(connection).has_table("schema_migrations"):
         applied = {
             row[0] for row in connection.execute(text("SELECT version FROM schema_migrations"))
         }
@@ -12,6 +12,11 @@ from . import (
     v0004_add_plant_watering_events,
     v0005_add_plant_images,
     v0006_add_plant_tracking_fields,
+    v0007_add_task_due_index,
+    v0008_add_plant_banner_index,
+    v0009_add_plant_village_index,
+    v0010_add_village_filter_indexes,
+    v0011_add_version_columns,
 )
 
 Migration = Tuple[str, Callable[[Connection], None]]
@@ -23,6 +28,11 @@ MIGRATIONS: List[Migration] = [
     (v0004_add_plant_watering_events.VERSION, v0004_add_plant_watering_events.apply),
     (v0005_add_plant_images.VERSION, v0005_add_plant_images.apply),
     (v0006_add_plant_tracking_fields.VERSION, v0006_add_plant_tracking_fields.apply),
+    (v0007_add_task_due_index.VERSION, v0007_add_task_due_index.apply),
+    (v0008_add_plant_banner_index.VERSION, v0008_add_plant_banner_index.apply),
+    (v0009_add_plant_village_index.VERSION, v0009_add_plant_village_index.apply),
+    (v0010_add_village_filter_indexes.VERSION, v0010_add_village_filter_indexes.apply),
+    (v0011_add_version_columns.VERSION, v0011_add_version_columns.apply),
 ]
 
 LATEST_VERSION = MIGRATIONS[-1][0]
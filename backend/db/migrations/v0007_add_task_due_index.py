@@ -0,0 +1,21 @@
+"""Index tasks by due time for the ordered today list."""
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+VERSION = "0007_add_task_due_index"
+
+
+def apply(connection: Connection) -> None:
+    """Create the ``tasks.due_at`` index when missing."""
+
+    connection.execute(
+        text(
+            """
+            CREATE INDEX IF NOT EXISTS ix_tasks_due_at
+            ON tasks (due_at)
+            """
+        )
+    )
@@ -0,0 +1,22 @@
+"""Partially index plants with images for village banner lookups."""
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+VERSION = "0008_add_plant_banner_index"
+
+
+def apply(connection: Connection) -> None:
+    """Create the partial ``plants`` banner index when missing."""
+
+    connection.execute(
+        text(
+            """
+            CREATE INDEX IF NOT EXISTS ix_plants_village_banner
+            ON plants (village_id, updated_at)
+            WHERE image_url IS NOT NULL
+            """
+        )
+    )
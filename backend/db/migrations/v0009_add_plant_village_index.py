@@ -0,0 +1,21 @@
+"""Index plants by village for per-village counts and listings."""
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+VERSION = "0009_add_plant_village_index"
+
+
+def apply(connection: Connection) -> None:
+    """Create the ``plants.village_id`` index declared on the model when missing."""
+
+    connection.execute(
+        text(
+            """
+            CREATE INDEX IF NOT EXISTS ix_plants_village_id
+            ON plants (village_id)
+            """
+        )
+    )
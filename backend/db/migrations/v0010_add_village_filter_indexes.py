@@ -0,0 +1,37 @@
+"""Index the village columns the list endpoint filters and sorts on."""
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+VERSION = "0010_add_village_filter_indexes"
+
+
+def apply(connection: Connection) -> None:
+    """Create the ``villages`` name, climate and health indexes when missing."""
+
+    connection.execute(
+        text(
+            """
+            CREATE INDEX IF NOT EXISTS ix_villages_name
+            ON villages (name)
+            """
+        )
+    )
+    connection.execute(
+        text(
+            """
+            CREATE INDEX IF NOT EXISTS ix_villages_climate
+            ON villages (climate)
+            """
+        )
+    )
+    connection.execute(
+        text(
+            """
+            CREATE INDEX IF NOT EXISTS ix_villages_health_score
+            ON villages (health_score)
+            """
+        )
+    )
@@ -0,0 +1,29 @@
+"""Add integer row versions that guard ORM updates against concurrent writers."""
+from __future__ import annotations
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+VERSION = "0011_add_version_columns"
+
+
+def apply(connection: Connection) -> None:
+    """Add ``version`` counters to villages and plants when missing."""
+
+    def _ensure_version(table_name: str) -> None:
+        columns = {column["name"] for column in inspect(connection).get_columns(table_name)}
+        if "version" in columns:
+            return
+
+        connection.execute(
+            text(
+                f"""
+                ALTER TABLE {table_name}
+                ADD COLUMN version INTEGER NOT NULL DEFAULT 1
+                """
+            )
+        )
+
+    _ensure_version("villages")
+    _ensure_version("plants")
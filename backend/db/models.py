@@ -3,8 +3,21 @@ from __future__ import annotations
 
 from datetime import date, datetime, timezone
 
-from sqlalchemy import JSON, Date, DateTime, Float, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import (
+    JSON,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 
 def _utcnow() -> datetime:
@@ -13,6 +26,27 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+class UtcDateTime(TypeDecorator[datetime]):
+    """``DateTime`` that always stores UTC and always loads aware UTC values.
+
+    SQLite keeps no offset, so values are converted to UTC on the way in and
+    tagged as UTC on the way out; callers never see naive timestamps.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect) -> datetime | None:
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    def process_result_value(self, value: datetime | None, dialect) -> datetime | None:
+        if value is None:
+            return None
+        return value.replace(tzinfo=timezone.utc)
+
+
 class Base(DeclarativeBase):
     """Base declarative class used by all models."""
 
@@ -23,21 +57,27 @@ class Village(Base):
     __tablename__ = "villages"
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    name: Mapped[str] = mapped_column(String, nullable=False)
-    climate: Mapped[str] = mapped_column(String, nullable=False)
+    name: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    climate: Mapped[str] = mapped_column(String, nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(Text)
     established_at: Mapped[date | None] = mapped_column(Date)
     irrigation_type: Mapped[str | None] = mapped_column(String)
-    health_score: Mapped[float] = mapped_column(Float, nullable=False)
+    health_score: Mapped[float] = mapped_column(Float, nullable=False, index=True)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UtcDateTime(),
         nullable=False,
         default=_utcnow,
         onupdate=_utcnow,
     )
+    # The ORM bumps the version on every flush and adds ``WHERE version = :loaded``
+    # to the UPDATE, so a write racing another request fails instead of
+    # silently overwriting it.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
 
     plants: Mapped[list["Plant"]] = relationship(
-        "Plant", back_populates="village", cascade="all, delete-orphan"
+        "Plant", back_populates="village", cascade="all, delete-orphan", passive_deletes=True
     )
 
 
@@ -45,13 +85,24 @@ class Plant(Base):
     """Persistent representation of a plant."""
 
     __tablename__ = "plants"
+    __table_args__ = (
+        Index(
+            "ix_plants_village_banner",
+            "village_id",
+            "updated_at",
+            sqlite_where=text("image_url IS NOT NULL"),
+            postgresql_where=text("image_url IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    village_id: Mapped[str] = mapped_column(ForeignKey("villages.id"), nullable=False, index=True)
+    village_id: Mapped[str] = mapped_column(
+        ForeignKey("villages.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     display_name: Mapped[str] = mapped_column(String, nullable=False)
     species: Mapped[str] = mapped_column(String, nullable=False)
     stage: Mapped[str] = mapped_column(String, nullable=False)
-    last_watered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_watered_at: Mapped[datetime | None] = mapped_column(UtcDateTime())
     health_score: Mapped[float] = mapped_column(Float, nullable=False)
     notes: Mapped[str | None] = mapped_column(Text)
     image_url: Mapped[str | None] = mapped_column(Text)
@@ -69,20 +120,24 @@ class Plant(Base):
     amount: Mapped[str | None] = mapped_column(String)
     activity_log: Mapped[list[dict[str, object]] | None] = mapped_column(JSON)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UtcDateTime(),
         nullable=False,
         default=_utcnow,
         onupdate=_utcnow,
     )
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
 
     village: Mapped[Village] = relationship("Village", back_populates="plants")
     tasks: Mapped[list["Task"]] = relationship(
-        "Task", back_populates="plant", cascade="all, delete-orphan"
+        "Task", back_populates="plant", cascade="all, delete-orphan", passive_deletes=True
     )
     waterings: Mapped[list["PlantWateringEvent"]] = relationship(
         "PlantWateringEvent",
         back_populates="plant",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="PlantWateringEvent.watered_at",
     )
 
@@ -94,10 +149,14 @@ class Task(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     task_type: Mapped[str] = mapped_column("type", String, nullable=False)
-    plant_id: Mapped[str] = mapped_column(ForeignKey("plants.id"), nullable=False, index=True)
+    plant_id: Mapped[str] = mapped_column(
+        ForeignKey("plants.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     plant_name: Mapped[str] = mapped_column(String, nullable=False)
     village_name: Mapped[str] = mapped_column(String, nullable=False)
-    due_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    due_at: Mapped[datetime] = mapped_column(
+        UtcDateTime(), nullable=False, index=True
+    )
     priority: Mapped[str] = mapped_column(String, nullable=False)
 
     plant: Mapped[Plant] = relationship("Plant", back_populates="tasks")
@@ -110,10 +169,12 @@ class PlantWateringEvent(Base):
     __table_args__ = (UniqueConstraint("plant_id", "watered_at"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    plant_id: Mapped[str] = mapped_column(ForeignKey("plants.id"), nullable=False, index=True)
+    plant_id: Mapped[str] = mapped_column(
+        ForeignKey("plants.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     watered_at: Mapped[date] = mapped_column(Date, nullable=False)
     recorded_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utcnow
+        UtcDateTime(), nullable=False, default=_utcnow
     )
 
     plant: Mapped[Plant] = relationship("Plant", back_populates="waterings")
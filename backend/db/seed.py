@@ -4,22 +4,25 @@ from __future__ import annotations
 from datetime import date, datetime, timezone
 from typing import Any, Dict, Iterable, List
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from backend.data import seed_content
 from backend.db import models
 
 
+# fromisoformat is implemented in C and, on the supported Python 3.12, accepts a
+# trailing "Z", so neither a string rewrite nor strptime's format parsing is needed.
 def _parse_datetime(value: str | None) -> datetime | None:
     if value is None:
         return None
-    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+    return datetime.fromisoformat(value).astimezone(timezone.utc)
 
 
 def _parse_date(value: str | None) -> date | None:
     if value is None:
         return None
-    return datetime.strptime(value, "%Y-%m-%d").date()
+    return date.fromisoformat(value)
 
 
 def _clean_text(value: Any) -> str | None:
@@ -61,85 +64,85 @@ def _sanitize_activity_log(entries: Any) -> List[Dict[str, Any]]:
 def seed_demo_data(session: Session) -> None:
     """Populate the database with the canonical seed data when empty."""
 
-    has_villages = session.query(models.Village).first() is not None
+    has_villages = session.execute(select(models.Village.id).limit(1)).first() is not None
     if has_villages:
         return
 
-    villages = {
-        village["id"]: models.Village(
-            id=village["id"],
-            name=village["name"],
-            climate=village["climate"],
-            description=village["description"],
-            established_at=_parse_date(village["established_at"]),
-            irrigation_type=village["irrigation_type"],
-            health_score=village["health_score"],
-        )
+    # Each table is written with a single executemany INSERT rather than
+    # constructing ORM instances and flushing them table by table.
+    village_rows = [
+        {
+            "id": village["id"],
+            "name": village["name"],
+            "climate": village["climate"],
+            "description": village["description"],
+            "established_at": _parse_date(village["established_at"]),
+            "irrigation_type": village["irrigation_type"],
+            "health_score": village["health_score"],
+        }
         for village in seed_content.VILLAGES
-    }
-    session.add_all(villages.values())
-    session.flush()
-
-    plants = {
-        plant["id"]: models.Plant(
-            id=plant["id"],
-            village_id=plant["village_id"],
-            display_name=plant["display_name"],
-            species=plant["species"],
-            stage=plant["stage"],
-            last_watered_at=_parse_datetime(plant["last_watered_at"]),
-            health_score=plant["health_score"],
-            notes=plant["notes"],
-            image_url=plant.get("image_url"),
-            family=_clean_text(plant.get("family")),
-            plant_origin=_clean_text(plant.get("plant_origin")),
-            natural_habitat=_clean_text(plant.get("natural_habitat")),
-            room=_clean_text(plant.get("room")),
-            sunlight=_clean_text(plant.get("sunlight")),
-            pot_size=_clean_text(plant.get("pot_size")),
-            purchased_on=_parse_date(plant.get("purchased_on")),
-            last_watered=_parse_date(plant.get("last_watered")),
-            last_repotted=_parse_date(plant.get("last_repotted")),
-            dormancy=_clean_text(plant.get("dormancy")),
-            water_average=_clean_text(plant.get("water_average")),
-            amount=_clean_text(plant.get("amount")),
-            activity_log=_sanitize_activity_log(plant.get("activity_log")) or None,
-        )
+    ]
+    session.execute(insert(models.Village), village_rows)
+
+    plant_rows = [
+        {
+            "id": plant["id"],
+            "village_id": plant["village_id"],
+            "display_name": plant["display_name"],
+            "species": plant["species"],
+            "stage": plant["stage"],
+            "last_watered_at": _parse_datetime(plant["last_watered_at"]),
+            "health_score": plant["health_score"],
+            "notes": plant["notes"],
+            "image_url": plant.get("image_url"),
+            "family": _clean_text(plant.get("family")),
+            "plant_origin": _clean_text(plant.get("plant_origin")),
+            "natural_habitat": _clean_text(plant.get("natural_habitat")),
+            "room": _clean_text(plant.get("room")),
+            "sunlight": _clean_text(plant.get("sunlight")),
+            "pot_size": _clean_text(plant.get("pot_size")),
+            "purchased_on": _parse_date(plant.get("purchased_on")),
+            "last_watered": _parse_date(plant.get("last_watered")),
+            "last_repotted": _parse_date(plant.get("last_repotted")),
+            "dormancy": _clean_text(plant.get("dormancy")),
+            "water_average": _clean_text(plant.get("water_average")),
+            "amount": _clean_text(plant.get("amount")),
+            "activity_log": _sanitize_activity_log(plant.get("activity_log")) or None,
+        }
         for plant in seed_content.PLANTS
-    }
-    session.add_all(plants.values())
-    session.flush()
+    ]
+    session.execute(insert(models.Plant), plant_rows)
 
-    watering_events: list[models.PlantWateringEvent] = []
+    plant_ids = {row["id"] for row in plant_rows}
+    watering_rows: list[Dict[str, Any]] = []
     for plant_id, dates in seed_content.PLANT_WATERINGS.items():
-        plant = plants.get(plant_id)
-        if plant is None:
+        if plant_id not in plant_ids:
             continue
         for index, watered_at in enumerate(dates, start=1):
             parsed = _parse_date(watered_at)
             if parsed is None:
                 continue
-            watering_events.append(
-                models.PlantWateringEvent(
-                    id=f"{plant_id}-watering-{index}",
-                    plant=plant,
-                    watered_at=parsed,
-                )
+            watering_rows.append(
+                {
+                    "id": f"{plant_id}-watering-{index}",
+                    "plant_id": plant_id,
+                    "watered_at": parsed,
+                }
             )
 
-    if watering_events:
-        session.add_all(watering_events)
-
-    tasks = [
-        models.Task(
-            id=task["id"],
-            task_type=task["type"],
-            plant_id=task["plant_id"],
-            plant_name=task["plant_name"],
-            village_name=task["village_name"],
-            due_at=_parse_datetime(task["due_at"]),
-            priority=task["priority"],
-        )
+    if watering_rows:
+        session.execute(insert(models.PlantWateringEvent), watering_rows)
+
+    task_rows = [
+        {
+            "id": task["id"],
+            "task_type": task["type"],
+            "plant_id": task["plant_id"],
+            "plant_name": task["plant_name"],
+            "village_name": task["village_name"],
+            "due_at": _parse_datetime(task["due_at"]),
+            "priority": task["priority"],
+        }
         for task in seed_content.TODAY_TASKS
     ]
-    session.add_all(tasks)
+    session.execute(insert(models.Task), task_rows)
@@ -6,8 +6,9 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 DEFAULT_DB_FILENAME = "plantit.db"
 DB_PATH = Path(os.environ.get("PLANTIT_DB_PATH", Path(__file__).resolve().parent.parent / DEFAULT_DB_FILENAME))
@@ -15,12 +16,52 @@ DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# Sync routes run on AnyIO's worker threads (40 by default), so the pool is
+# sized to hand every worker a connection instead of queueing behind
+# SQLAlchemy's default of 5 + 10 overflow.
+POOL_SIZE = int(os.environ.get("PLANTIT_DB_POOL_SIZE", "20"))
+MAX_OVERFLOW = int(os.environ.get("PLANTIT_DB_MAX_OVERFLOW", "40"))
+
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
     pool_pre_ping=True,
 )
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+# Sessions live for one request and every write path serializes from the objects
+# it just wrote, so commits skip expiring the identity map; nothing read after a
+# commit should trigger a reload.
+SessionLocal = sessionmaker(
+    bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
+)
+
+# Applied to every new DBAPI connection: WAL lets readers proceed while a writer
+# commits, and synchronous=NORMAL is durable under WAL without an fsync per commit.
+# foreign_keys turns on the REFERENCES ... ON DELETE CASCADE clauses declared by
+# the migrations, so SQLite checks and cascades child rows itself.
+SQLITE_PRAGMAS = (
+    ("foreign_keys", "ON"),
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", "-65536"),
+    ("busy_timeout", "5000"),
+    ("mmap_size", "268435456"),
+)
+
+
+@event.listens_for(engine, "connect")
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Tune each new SQLite connection for concurrent reads and cheap commits."""
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
 
 
 def get_session() -> Iterator[Session]:
@@ -34,11 +75,18 @@ def get_session() -> Iterator[Session]:
 
 
 @contextmanager
-def session_scope() -> Iterator[Session]:
-    """Provide a transactional scope for scripts such as the seed runner."""
+def session_scope(*, immediate: bool = False) -> Iterator[Session]:
+    """Provide a transactional scope for scripts such as the seed runner.
+
+    With ``immediate`` the transaction opens with ``BEGIN IMMEDIATE`` so it holds
+    SQLite's write lock from the start; a check-then-insert such as seeding then
+    cannot interleave with another process doing the same.
+    """
 
     session = SessionLocal()
     try:
+        if immediate:
+            session.execute(text("BEGIN IMMEDIATE"))
         yield session
         session.commit()
     except Exception:
@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import logging
 from pathlib import Path
 from typing import Iterable
 
 import uvicorn
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import Response
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.staticfiles import StaticFiles
 
 from backend.app import app as backend_app
 
@@ -30,8 +34,13 @@ class UnifiedApplication:
             raise FileNotFoundError("index.html is required for the unified server")
 
         self._backend = backend_app
-        self._static_root = static_root
-        self._index_path = index_path
+        # StaticFiles normalizes the path, rejects anything resolving outside the
+        # root and does its filesystem lookups off the event loop.
+        self._static_files = StaticFiles(directory=static_root)
+        # The SPA shell is served for every client-side route, so it is read once
+        # here instead of being stat-ed and reopened by a FileResponse per request.
+        self._index_bytes = index_path.read_bytes()
+        self._index_etag = f'"{hashlib.blake2b(self._index_bytes, digest_size=16).hexdigest()}"'
         self._backend_paths: Iterable[str] = ("/docs", "/openapi.json", "/redoc")
 
     async def __call__(self, scope, receive, send):  # noqa: D401 - ASGI callable signature
@@ -56,27 +65,24 @@ class UnifiedApplication:
         await self._serve_static(scope, receive, send, path)
 
     async def _serve_static(self, scope, receive, send, path: str) -> None:
-        try:
-            asset_path = self._resolve_asset(path)
-        except FileNotFoundError:
-            response: Response = FileResponse(self._index_path)
+        response: Response
+        if path in {"", "/"}:
+            response = self._index_response(scope)
         else:
-            response = FileResponse(asset_path)
+            try:
+                response = await self._static_files.get_response(
+                    self._static_files.get_path(scope), scope
+                )
+            except HTTPException:
+                response = self._index_response(scope)
 
         await response(scope, receive, send)
 
-    def _resolve_asset(self, path: str) -> Path:
-        if path in {"", "/"}:
-            return self._index_path
-
-        candidate = self._static_root / path.lstrip("/")
-        if candidate.is_dir():
-            candidate = candidate / "index.html"
-
-        if not candidate.exists():
-            raise FileNotFoundError(path)
-
-        return candidate
+    def _index_response(self, scope) -> Response:
+        headers = {"ETag": self._index_etag}
+        if Headers(scope=scope).get("if-none-match") == self._index_etag:
+            return Response(status_code=304, headers=headers)
+        return Response(self._index_bytes, media_type="text/html", headers=headers)
 
 
 STATIC_ROOT = Path(__file__).parent / "frontend"
@@ -5,9 +5,24 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure the repository root is on the import path so ``backend`` and ``plantit``
 # packages can be imported when tests are executed from arbitrary working
 # directories.
 REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _bootstrap_database() -> None:
+    """Migrate and seed once, as the app's startup hook does under a server.
+
+    Most tests drive a ``TestClient`` without entering it as a context manager, so
+    the startup event never fires for them.
+    """
+
+    from backend.app import _bootstrap_once
+
+    _bootstrap_once()
@@ -0,0 +1,56 @@
+"""Tests for the database engine configuration."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm.exc import StaleDataError
+
+from backend.db import models
+from backend.db.session import MAX_OVERFLOW, POOL_SIZE, engine, session_scope
+
+
+def test_sqlite_connections_use_wal_and_tuned_pragmas() -> None:
+    with engine.connect() as connection:
+        journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar_one()
+        synchronous = connection.execute(text("PRAGMA synchronous")).scalar_one()
+        busy_timeout = connection.execute(text("PRAGMA busy_timeout")).scalar_one()
+        foreign_keys = connection.execute(text("PRAGMA foreign_keys")).scalar_one()
+
+    assert journal_mode.lower() == "wal"
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == 5000
+    assert foreign_keys == 1
+
+
+def test_engine_pool_covers_worker_threads() -> None:
+    assert engine.pool.size() == POOL_SIZE
+    assert POOL_SIZE + MAX_OVERFLOW >= 40
+
+
+def test_immediate_session_scope_holds_write_lock() -> None:
+    with session_scope(immediate=True) as session:
+        dbapi_connection = session.connection().connection.dbapi_connection
+        assert dbapi_connection.in_transaction
+
+
+def test_commit_keeps_loaded_objects_usable() -> None:
+    with session_scope() as session:
+        village = session.scalars(select(models.Village).limit(1)).one()
+        session.commit()
+        assert "name" in village.__dict__
+
+
+def test_concurrent_village_writes_raise_stale_data() -> None:
+    with session_scope() as session:
+        village_id = session.scalars(select(models.Village.id).limit(1)).one()
+
+    with session_scope() as first, session_scope() as second:
+        stale = second.get(models.Village, village_id)
+        winner = first.get(models.Village, village_id)
+        winner.updated_at = datetime.now(timezone.utc)
+        first.commit()
+
+        stale.updated_at = datetime.now(timezone.utc)
+        with pytest.raises(StaleDataError):
+            second.flush()
+        second.rollback()
@@ -0,0 +1,26 @@
+"""Tests for primary-key generation."""
+import time
+from uuid import RFC_4122
+
+from backend.db.ids import new_id, uuid7
+
+
+def test_uuid7_sets_version_and_variant() -> None:
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == RFC_4122
+
+
+def test_uuid7_leads_with_the_millisecond_timestamp() -> None:
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_new_ids_sort_by_creation_time() -> None:
+    first = new_id()
+    time.sleep(0.002)
+    second = new_id()
+    assert first < second
+    assert len({new_id() for _ in range(1000)}) == 1000
@@ -1,13 +1,17 @@
 """Integration tests for Phase 10 read-path endpoints."""
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event, update
 
-from backend.app import app, _reset_dashboard_alerts
+from backend import app as backend_app
+from backend.app import app, _etag_matches, _reset_dashboard_alerts
 from backend.db import models
-from backend.db.session import session_scope
+from backend.db.session import engine, session_scope
 
 SAMPLE_IMAGE_DATA = "data:image/gif;base64,R0lGODlhAQABAAAAACwAAAAAAQABAAA="
 
@@ -21,6 +25,20 @@ def _reset_alerts_fixture():
     _reset_dashboard_alerts()
 
 
+@contextmanager
+def _capture_statements() -> Iterator[List[str]]:
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
 def _get_first_village_id() -> str:
     response = client.get("/api/villages")
     assert response.status_code == 200, response.text
@@ -146,6 +164,7 @@ def test_today_endpoint_returns_tasks() -> None:
         }
         for task in tasks:
             assert expected_task_keys.issubset(task.keys()), task
+            assert task["dueAt"].endswith("+00:00"), task
 
 
 def test_create_update_delete_village_flow() -> None:
@@ -358,3 +377,498 @@ def test_delete_village_removes_dependent_records() -> None:
         assert session.get(models.Village, village_id) is None
         assert session.get(models.Plant, plant_id) is None
         assert session.get(models.Task, task_id) is None
+
+
+def test_delete_plant_removes_dependent_records() -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+    plant_id = plant["id"]
+    task_id = _create_task(plant_id, plant["displayName"], village["name"])
+
+    watering = client.post(f"/api/plants/{plant_id}/waterings", json={})
+    assert watering.status_code == 201, watering.text
+    watered_plant = watering.json()["plant"]
+
+    delete_response = client.request(
+        "DELETE",
+        f"/api/plants/{plant_id}",
+        json={"updatedAt": watered_plant["updatedAt"]},
+    )
+    assert delete_response.status_code == 200, delete_response.text
+    updated_village = delete_response.json().get("village")
+    assert updated_village["plantCount"] == 0
+
+    with session_scope() as session:
+        assert session.get(models.Plant, plant_id) is None
+        assert session.get(models.Task, task_id) is None
+        remaining_waterings = (
+            session.query(models.PlantWateringEvent).filter_by(plant_id=plant_id).count()
+        )
+        assert remaining_waterings == 0
+
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": updated_village["updatedAt"]},
+    )
+
+
+def test_record_watering_returns_updated_history() -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+    plant_id = plant["id"]
+
+    watering = client.post(f"/api/plants/{plant_id}/waterings", json={})
+    assert watering.status_code == 201, watering.text
+    watered_plant = watering.json()["plant"]
+    today = datetime.now(timezone.utc).date().isoformat()
+    assert today in watered_plant["watering"]["history"]
+    assert watered_plant["watering"]["hasWateringToday"] is True
+
+    detail = client.get(f"/api/plants/{plant_id}")
+    assert detail.status_code == 200, detail.text
+    assert detail.json()["plant"]["updatedAt"] == watered_plant["updatedAt"]
+
+    current_village = client.get(f"/api/villages/{village['id']}").json()["village"]
+    cleanup = client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": current_village["updatedAt"]},
+    )
+    assert cleanup.status_code == 200, cleanup.text
+
+
+def test_dismiss_due_watering_plant_hides_it_for_today() -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+    plant_id = plant["id"]
+    today = datetime.now(timezone.utc).date()
+    for days_ago in (12, 8, 4):
+        watered_on = (today - timedelta(days=days_ago)).isoformat()
+        response = client.post(f"/api/plants/{plant_id}/waterings", json={"wateredAt": watered_on})
+        assert response.status_code == 201, response.text
+
+    due_response = client.get("/api/watering/due")
+    # generatedAt makes every body unique, so no validator is offered.
+    assert "etag" not in due_response.headers
+    due_ids = {item["id"] for item in due_response.json()["plants"]}
+    assert plant_id in due_ids
+
+    dismissed = client.post(f"/api/watering/due/{plant_id}/dismiss")
+    assert dismissed.status_code == 200, dismissed.text
+    assert dismissed.json()["dismissedUntil"] == today.isoformat()
+
+    due_ids = {item["id"] for item in client.get("/api/watering/due").json()["plants"]}
+    assert plant_id not in due_ids
+
+    missing = client.post(f"/api/watering/due/{uuid4()}/dismiss")
+    assert missing.status_code == 404
+
+    current_village = client.get(f"/api/villages/{village['id']}").json()["village"]
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": current_village["updatedAt"]},
+    )
+
+
+def test_delete_plant_conflict_returns_409() -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+    plant_id = plant["id"]
+
+    stale = client.request(
+        "DELETE",
+        f"/api/plants/{plant_id}",
+        json={"updatedAt": "2000-01-01T00:00:00Z"},
+    )
+    assert stale.status_code == 409, stale.text
+    assert client.get(f"/api/plants/{plant_id}").status_code == 200
+
+    missing = client.request(
+        "DELETE",
+        f"/api/plants/{uuid4()}",
+        json={"updatedAt": plant["updatedAt"]},
+    )
+    assert missing.status_code == 404
+
+    current_village = client.get(f"/api/villages/{village['id']}").json()["village"]
+    cleanup = client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": current_village["updatedAt"]},
+    )
+    assert cleanup.status_code == 200, cleanup.text
+
+
+def test_import_preview_rejects_non_object_bundles() -> None:
+    malformed = client.post(
+        "/api/import", content=b"{not json", headers={"Content-Type": "application/json"}
+    )
+    assert malformed.status_code == 422
+
+    not_an_object = client.post("/api/import", json=[{"schemaVersion": 1}])
+    assert not_an_object.status_code == 422
+
+
+def test_activity_log_is_normalized_on_write_and_returned_on_read() -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+    payload = {
+        "displayName": plant["displayName"],
+        "species": plant["species"],
+        "stage": plant["stage"],
+        "healthScore": plant["healthScore"],
+        "updatedAt": plant["updatedAt"],
+        "activityLog": [
+            {"date": "2024-05-01", "type": "water", "note": "Deep soak", "amount": 250},
+            {"date": "not-a-date", "note": None, "method": "mist"},
+            "ignored",
+        ],
+    }
+    response = client.put(f"/api/plants/{plant['id']}", json=payload)
+    assert response.status_code == 200, response.text
+    expected = [
+        {"date": "2024-05-01", "type": "water", "note": "Deep soak", "amount": "250"},
+        {"date": None, "type": "note", "note": "", "method": "mist"},
+    ]
+    assert response.json()["plant"]["activityLog"] == expected
+
+    detail = client.get(f"/api/plants/{plant['id']}")
+    assert detail.json()["plant"]["activityLog"] == expected
+
+    current_village = client.get(f"/api/villages/{village['id']}").json()["village"]
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": current_village["updatedAt"]},
+    )
+
+
+def test_offset_timestamps_are_stored_as_utc() -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+    response = client.put(
+        f"/api/plants/{plant['id']}",
+        json={
+            "displayName": plant["displayName"],
+            "species": plant["species"],
+            "stage": plant["stage"],
+            "healthScore": plant["healthScore"],
+            "lastWateredAt": "2024-04-12T01:30:00+02:00",
+            "updatedAt": plant["updatedAt"],
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    detail = client.get(f"/api/plants/{plant['id']}")
+    assert detail.json()["plant"]["lastWateredAt"] == "2024-04-11T23:30:00Z"
+
+    with session_scope() as session:
+        stored = session.get(models.Plant, plant["id"])
+        assert stored.last_watered_at.tzinfo is timezone.utc
+
+    current_village = client.get(f"/api/villages/{village['id']}").json()["village"]
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": current_village["updatedAt"]},
+    )
+
+
+def test_moving_plant_returns_both_village_summaries() -> None:
+    source = _create_village()
+    target = _create_village()
+    plant = _create_plant(source["id"])
+
+    response = client.put(
+        f"/api/plants/{plant['id']}",
+        json={
+            "displayName": plant["displayName"],
+            "species": plant["species"],
+            "stage": plant["stage"],
+            "healthScore": plant["healthScore"],
+            "imageUrl": plant["imageUrl"],
+            "updatedAt": plant["updatedAt"],
+            "villageId": target["id"],
+        },
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["plant"]["villageId"] == target["id"]
+    assert body["village"]["id"] == target["id"]
+    assert body["village"]["plantCount"] == 1
+    assert body["village"]["bannerImageUrls"] == [plant["imageUrl"]]
+    assert body["previousVillage"]["id"] == source["id"]
+    assert body["previousVillage"]["plantCount"] == 0
+    assert body["previousVillage"]["bannerImageUrls"] == []
+
+    for village in (body["village"], body["previousVillage"]):
+        client.request(
+            "DELETE",
+            f"/api/villages/{village['id']}",
+            json={"updatedAt": village["updatedAt"]},
+        )
+
+
+def test_list_endpoints_answer_matching_etags_with_304() -> None:
+    for path in ("/api/villages", "/api/today"):
+        first = client.get(path)
+        assert first.status_code == 200, first.text
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        cached = client.get(path, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+
+        stale = client.get(path, headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert stale.json() == first.json()
+
+
+def test_export_etag_short_circuits_until_data_changes() -> None:
+    first = client.get("/api/export")
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get("/api/export", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    village = _create_village()
+    changed = client.get("/api/export", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": village["updatedAt"]},
+    )
+
+
+def test_village_list_etag_tracks_plant_changes() -> None:
+    village = _create_village()
+    path = f"/api/villages/{village['id']}/plants"
+    first = client.get(path)
+    assert first.status_code == 200, first.text
+    etag = first.headers["etag"]
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+    _create_plant(village["id"])
+    changed = client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(changed.json()["plants"]) == 1
+
+    filtered = client.get("/api/villages", params={"searchTerm": village["name"]})
+    unfiltered = client.get("/api/villages")
+    assert filtered.headers["etag"] != unfiltered.headers["etag"]
+
+    current = changed.json()["village"]
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": current["updatedAt"]},
+    )
+
+
+def test_etag_matching_accepts_lists_and_weak_forms() -> None:
+    assert _etag_matches('W/"abc"', 'W/"abc"')
+    assert _etag_matches('"abc"', 'W/"abc"')
+    assert _etag_matches('"zzz", W/"abc"', '"abc"')
+    assert _etag_matches("*", '"abc"')
+    assert not _etag_matches('"abd"', '"abc"')
+    assert not _etag_matches(None, '"abc"')
+
+
+def test_detail_etags_short_circuit_until_the_entity_changes() -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+
+    for path in (f"/api/villages/{village['id']}", f"/api/plants/{plant['id']}"):
+        first = client.get(path)
+        assert first.status_code == 200, first.text
+        cached = client.get(path, headers={"If-None-Match": first.headers["etag"]})
+        assert cached.status_code == 304
+
+    village_etag = client.get(f"/api/villages/{village['id']}").headers["etag"]
+    plant_etag = client.get(f"/api/plants/{plant['id']}").headers["etag"]
+    watered = client.post(f"/api/plants/{plant['id']}/waterings", json={})
+    assert watered.status_code == 201, watered.text
+
+    plant_after = client.get(
+        f"/api/plants/{plant['id']}", headers={"If-None-Match": plant_etag}
+    )
+    assert plant_after.status_code == 200
+    assert plant_after.json()["plant"]["watering"]["hasWateringToday"] is True
+    village_after = client.get(
+        f"/api/villages/{village['id']}", headers={"If-None-Match": village_etag}
+    )
+    assert village_after.status_code == 200
+
+    assert client.get("/api/plants/missing-plant").status_code == 404
+    assert client.get("/api/villages/missing-village").status_code == 404
+
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": village_after.json()["village"]["updatedAt"]},
+    )
+
+
+def test_write_responses_summarize_villages_from_rollups() -> None:
+    village = _create_village()
+    payload = {
+        "villageId": village["id"],
+        "displayName": "Rollup Plant",
+        "species": "Testus plantus",
+        "stage": "seedling",
+        "healthScore": 0.5,
+        "imageUrl": SAMPLE_IMAGE_DATA,
+    }
+    created = client.post("/api/plants", json=payload)
+    assert created.status_code == 201, created.text
+    assert created.json()["village"]["plantCount"] == 1
+    assert created.json()["village"]["bannerImageUrls"] == [SAMPLE_IMAGE_DATA]
+
+    village_summary = created.json()["village"]
+    updated = client.put(
+        f"/api/villages/{village['id']}",
+        json={
+            "name": village["name"],
+            "climate": "Arid",
+            "healthScore": 0.7,
+            "updatedAt": village_summary["updatedAt"],
+        },
+    )
+    assert updated.status_code == 200, updated.text
+    assert updated.json()["village"]["plantCount"] == 1
+    assert updated.json()["village"]["bannerImageUrls"] == [SAMPLE_IMAGE_DATA]
+
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": updated.json()["village"]["updatedAt"]},
+    )
+
+
+def test_plant_paths_issue_a_fixed_number_of_queries() -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+
+    with _capture_statements() as statements:
+        response = client.get(f"/api/plants/{plant['id']}")
+    assert response.status_code == 200, response.text
+    # Version check, plant joined to its village, then the waterings.
+    assert len(statements) == 3, statements
+
+    with _capture_statements() as statements:
+        response = client.put(
+            f"/api/plants/{plant['id']}",
+            json={
+                "displayName": "Counted Plant",
+                "species": plant["species"],
+                "stage": plant["stage"],
+                "lastWateredAt": plant["lastWateredAt"],
+                "healthScore": plant["healthScore"],
+                "updatedAt": plant["updatedAt"],
+            },
+        )
+    assert response.status_code == 200, response.text
+    # Load, waterings, two UPDATEs and the summary rollup.
+    assert len(statements) == 5, statements
+
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": response.json()["village"]["updatedAt"]},
+    )
+
+
+def test_version_tokens_match_by_instant_across_offsets() -> None:
+    village = _create_village()
+    stored = datetime.fromisoformat(village["updatedAt"].replace("Z", "+00:00"))
+    shifted = stored.astimezone(timezone(timedelta(hours=2))).isoformat()
+
+    response = client.put(
+        f"/api/villages/{village['id']}",
+        json={
+            "name": village["name"],
+            "climate": village["climate"],
+            "healthScore": village["healthScore"],
+            "updatedAt": shifted,
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["village"]["updatedAt"].endswith("Z")
+
+    stale = client.put(
+        f"/api/villages/{village['id']}",
+        json={
+            "name": village["name"],
+            "climate": village["climate"],
+            "healthScore": village["healthScore"],
+            "updatedAt": shifted,
+        },
+    )
+    assert stale.status_code == 409
+
+    client.request(
+        "DELETE",
+        f"/api/villages/{village['id']}",
+        json={"updatedAt": response.json()["village"]["updatedAt"]},
+    )
+
+
+def _bump_version_after_check(monkeypatch, check_name: str, model, row_id: str) -> None:
+    """Simulate a concurrent PUT committing between the version check and the DELETE."""
+
+    original_check = getattr(backend_app, check_name)
+
+    def _check_then_bump(current, expected) -> None:
+        original_check(current, expected)
+        with session_scope() as session:
+            session.execute(
+                update(model).where(model.id == row_id).values(version=model.version + 1)
+            )
+
+    monkeypatch.setattr(backend_app, check_name, _check_then_bump)
+
+
+def test_deletes_conflict_when_a_write_lands_after_the_version_check(monkeypatch) -> None:
+    village = _create_village()
+    plant = _create_plant(village["id"])
+    village_before = client.get(f"/api/villages/{village['id']}").json()["village"]
+
+    with monkeypatch.context() as patch:
+        _bump_version_after_check(patch, "_assert_plant_version", models.Plant, plant["id"])
+        response = client.request(
+            "DELETE", f"/api/plants/{plant['id']}", json={"updatedAt": plant["updatedAt"]}
+        )
+    assert response.status_code == 409, response.text
+    assert client.get(f"/api/plants/{plant['id']}").status_code == 200
+    # The failed delete must not have touched the owning village either.
+    village_after = client.get(f"/api/villages/{village['id']}").json()["village"]
+    assert village_after["updatedAt"] == village_before["updatedAt"]
+
+    with monkeypatch.context() as patch:
+        _bump_version_after_check(
+            patch, "_assert_village_version", models.Village, village["id"]
+        )
+        response = client.request(
+            "DELETE",
+            f"/api/villages/{village['id']}",
+            json={"updatedAt": village_after["updatedAt"]},
+        )
+    assert response.status_code == 409, response.text
+    assert client.get(f"/api/villages/{village['id']}").status_code == 200
+
+    # The simulated write moved updated_at on as well, so re-read the token.
+    latest = client.get(f"/api/villages/{village['id']}").json()["village"]
+    cleanup = client.request(
+        "DELETE", f"/api/villages/{village['id']}", json={"updatedAt": latest["updatedAt"]}
+    )
+    assert cleanup.status_code == 200, cleanup.text
@@ -0,0 +1,29 @@
+"""Tests for the next-watering date prediction."""
+from datetime import date, timedelta
+
+from backend.app import _predict_next_watering_date
+
+
+def test_prediction_needs_two_distinct_dates() -> None:
+    assert _predict_next_watering_date([]) is None
+    assert _predict_next_watering_date([date(2024, 5, 1), date(2024, 5, 1)]) is None
+
+
+def test_prediction_follows_a_regular_cadence() -> None:
+    history = [date(2024, 5, 1) + timedelta(days=7 * week) for week in range(4)]
+    assert _predict_next_watering_date(history) == date(2024, 5, 29)
+
+
+def test_prediction_fits_irregular_history_regardless_of_order() -> None:
+    start = date(2024, 5, 1)
+    history = [start + timedelta(days=offset) for offset in (3, 0, 1)]
+    # Offsets 0, 1, 3 fit a slope of 1.5 and predict 4 1/3, rounded to day 4.
+    assert _predict_next_watering_date(history) == start + timedelta(days=4)
+
+
+def test_prediction_rounds_exact_halves_to_even() -> None:
+    start = date(2024, 5, 1)
+    history = [start + timedelta(days=offset) for offset in (0, 1, 3, 4)]
+    # Offsets 0, 1, 3, 4 predict exactly 5.5 days after the first watering.
+    predicted = start.toordinal() + 5.5
+    assert _predict_next_watering_date(history) == date.fromordinal(round(predicted))